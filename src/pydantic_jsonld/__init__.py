@@ -19,6 +19,7 @@ from .crypto_utils import (
 from .signatures import (
     sign_jsonld_document,
     verify_jsonld_document,
+    verify_jsonld_documents,
     canonicalize_jsonld,
 )
 
@@ -38,5 +39,6 @@ __all__ = [
     "public_key_from_base64",
     "sign_jsonld_document",
     "verify_jsonld_document",
+    "verify_jsonld_documents",
     "canonicalize_jsonld",
 ]
\ No newline at end of file
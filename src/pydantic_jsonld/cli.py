@@ -241,12 +241,12 @@ def inspect(module_path: str, model_names: tuple[str, ...]) -> None:
             config_table.add_row("Base IRI", str(getattr(model_class, '_json_ld_base', 'None')))
             config_table.add_row("Vocab IRI", str(getattr(model_class, '_json_ld_vocab', 'None')))
             config_table.add_row("Remote Contexts", str(getattr(model_class, '_json_ld_remote_contexts', [])))
-            config_table.add_row("Prefixes", str(getattr(model_class, '_json_ld_prefixes', {})))
+            config_table.add_row("Prefixes", str(dict(getattr(model_class, '_json_ld_prefixes', {}))))
             
             console.print(config_table)
             
             # Show field annotations
-            from .models import _JSONLD_META_KEY
+            from .models import _jsonld_field_table
             
             field_table = Table(title="Field Annotations")
             field_table.add_column("Field", style="cyan")
@@ -255,15 +255,13 @@ def inspect(module_path: str, model_names: tuple[str, ...]) -> None:
             field_table.add_column("JSON-LD Type", style="magenta")
             field_table.add_column("Container", style="blue")
             
-            for field_name, field_info in model_class.model_fields.items():
-                jsonld_meta = field_info.metadata.get(_JSONLD_META_KEY, {})
-                
+            for field in _jsonld_field_table(model_class):
                 field_table.add_row(
-                    field_name,
-                    str(field_info.annotation),
-                    jsonld_meta.get('iri', 'N/A'),
-                    jsonld_meta.get('type', 'N/A'),
-                    jsonld_meta.get('container', 'N/A')
+                    field.name,
+                    str(field.field_info.annotation),
+                    field.iri,
+                    field.type_ or 'N/A',
+                    field.container or 'N/A'
                 )
             
             console.print(field_table)
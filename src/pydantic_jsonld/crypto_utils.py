@@ -2,10 +2,44 @@
 Cryptographic utilities for Ed25519 key generation and management.
 """
 
-import base64
-from typing import Tuple
+from typing import List, Tuple
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
-from cryptography.hazmat.primitives import serialization
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    # (pip install pydantic-jsonld[fast])
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+
+def b64encode_str(data: bytes) -> str:
+    """
+    Base64-encode bytes to an ASCII string.
+    
+    Args:
+        data: Bytes to encode
+        
+    Returns:
+        Standard base64 string with padding
+    """
+    return base64.b64encode(data).decode('ascii')
+
+
+def b64decode_str(data: str) -> bytes:
+    """
+    Decode a base64 string to bytes.
+    
+    Args:
+        data: Standard base64 string
+        
+    Returns:
+        Decoded bytes
+        
+    Raises:
+        binascii.Error: If the input is not valid base64
+    """
+    return base64.b64decode(data)
 
 
 def generate_ed25519_keypair() -> Tuple[Ed25519PrivateKey, Ed25519PublicKey]:
@@ -30,11 +64,7 @@ def private_key_to_bytes(private_key: Ed25519PrivateKey) -> bytes:
     Returns:
         Raw private key bytes (32 bytes)
     """
-    return private_key.private_bytes(
-        encoding=serialization.Encoding.Raw,
-        format=serialization.PrivateFormat.Raw,
-        encryption_algorithm=serialization.NoEncryption()
-    )
+    return private_key.private_bytes_raw()
 
 
 def public_key_to_bytes(public_key: Ed25519PublicKey) -> bytes:
@@ -47,10 +77,7 @@ def public_key_to_bytes(public_key: Ed25519PublicKey) -> bytes:
     Returns:
         Raw public key bytes (32 bytes)
     """
-    return public_key.public_bytes(
-        encoding=serialization.Encoding.Raw,
-        format=serialization.PublicFormat.Raw
-    )
+    return public_key.public_bytes_raw()
 
 
 def private_key_from_bytes(key_bytes: bytes) -> Ed25519PrivateKey:
@@ -91,6 +118,31 @@ def public_key_from_bytes(key_bytes: bytes) -> Ed25519PublicKey:
     return Ed25519PublicKey.from_public_bytes(key_bytes)
 
 
+def public_keys_from_bytes(keys_bytes: bytes) -> List[Ed25519PublicKey]:
+    """
+    Create Ed25519 public keys from concatenated raw key bytes.
+    
+    Args:
+        keys_bytes: Raw public keys back to back (a multiple of 32 bytes)
+        
+    Returns:
+        List of Ed25519PublicKey instances, in order
+        
+    Raises:
+        ValueError: If keys_bytes is not a multiple of 32 bytes
+    """
+    if len(keys_bytes) % 32:
+        raise ValueError(
+            f"Ed25519 public keys must be a multiple of 32 bytes, got {len(keys_bytes)}"
+        )
+    
+    from_public_bytes = Ed25519PublicKey.from_public_bytes
+    return [
+        from_public_bytes(keys_bytes[i:i + 32])
+        for i in range(0, len(keys_bytes), 32)
+    ]
+
+
 def private_key_to_base64(private_key: Ed25519PrivateKey) -> str:
     """
     Convert Ed25519 private key to base64 string.
@@ -101,8 +153,7 @@ def private_key_to_base64(private_key: Ed25519PrivateKey) -> str:
     Returns:
         Base64-encoded private key string
     """
-    key_bytes = private_key_to_bytes(private_key)
-    return base64.b64encode(key_bytes).decode('ascii')
+    return b64encode_str(private_key_to_bytes(private_key))
 
 
 def public_key_to_base64(public_key: Ed25519PublicKey) -> str:
@@ -115,8 +166,7 @@ def public_key_to_base64(public_key: Ed25519PublicKey) -> str:
     Returns:
         Base64-encoded public key string
     """
-    key_bytes = public_key_to_bytes(public_key)
-    return base64.b64encode(key_bytes).decode('ascii')
+    return b64encode_str(public_key_to_bytes(public_key))
 
 
 def private_key_from_base64(key_b64: str) -> Ed25519PrivateKey:
@@ -133,7 +183,7 @@ def private_key_from_base64(key_b64: str) -> Ed25519PrivateKey:
         ValueError: If base64 string is invalid or wrong length
     """
     try:
-        key_bytes = base64.b64decode(key_b64)
+        key_bytes = b64decode_str(key_b64)
         return private_key_from_bytes(key_bytes)
     except Exception as e:
         raise ValueError(f"Invalid base64 private key: {e}")
@@ -153,7 +203,7 @@ def public_key_from_base64(key_b64: str) -> Ed25519PublicKey:
         ValueError: If base64 string is invalid or wrong length
     """
     try:
-        key_bytes = base64.b64decode(key_b64)
+        key_bytes = b64decode_str(key_b64)
         return public_key_from_bytes(key_bytes)
     except Exception as e:
         raise ValueError(f"Invalid base64 public key: {e}")
@@ -169,5 +219,6 @@ def generate_key_id(public_key: Ed25519PublicKey) -> str:
     Returns:
         Key identifier string (first 8 chars of base64 public key)
     """
-    key_b64 = public_key_to_base64(public_key)
-    return f"key-{key_b64[:8]}"
\ No newline at end of file
+    # 6 bytes encode to exactly 8 base64 characters with no padding, the
+    # same prefix as encoding the whole 32-byte key and slicing
+    return f"key-{b64encode_str(public_key.public_bytes_raw()[:6])}"
\ No newline at end of file
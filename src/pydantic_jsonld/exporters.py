@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Type, Union, get_origin, get_args
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 import re
+import time
 
 
 def export_context(model_class: Type[BaseModel]) -> Dict[str, Any]:
@@ -35,7 +36,7 @@ def export_shacl(model_class: Type[BaseModel]) -> Dict[str, Any]:
     Returns:
         Dictionary containing SHACL shape definition
     """
-    from .models import _JSONLD_META_KEY
+    from .models import _jsonld_field_table
     
     # Get the model's namespace info
     base_iri = getattr(model_class, '_json_ld_base', 'https://example.org/')
@@ -50,14 +51,9 @@ def export_shacl(model_class: Type[BaseModel]) -> Dict[str, Any]:
     # Build property shapes
     property_shapes = []
     
-    for field_name, field_info in model_class.model_fields.items():
-        # Get JSON-LD metadata from field
-        jsonld_meta = getattr(field_info, 'jsonld_meta', None)
-        if not jsonld_meta:
-            continue
-            
+    for field in _jsonld_field_table(model_class):
         property_shape = _build_property_shape(
-            field_name, field_info, jsonld_meta, base_iri
+            field.name, field.field_info, field.jsonld_meta, base_iri
         )
         if property_shape:
             property_shapes.append(property_shape)
@@ -259,48 +255,36 @@ def export_mixed_graph(
     
     # Generate graph ID if not provided
     if graph_id is None:
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        graph_id = f"mixed-graph-{timestamp}"
+        graph_id = f"mixed-graph-{time.time_ns()}"
     
-    # Collect all unique model classes
-    model_classes = list(set(type(model) for model in models))
+    # Collect all unique model classes, in order of first appearance
+    model_classes = list(dict.fromkeys(type(model) for model in models))
     
     # Merge contexts from all model classes
-    merged_context = {}
-    remote_contexts = []
+    merged_context: Dict[str, Any] = {}
+    remote_contexts: List[str] = []
     
     for model_class in model_classes:
-        # Check if it's a JsonLDModel
+        # Check if it's a JsonLDModel; export_context() returns a copy, so the
+        # merged term definitions are independent of the class's cache
         if hasattr(model_class, 'export_context'):
-            context_doc = model_class.export_context()
-            context = context_doc["@context"]
-            
-            if isinstance(context, list):
-                # Handle array contexts
-                for item in context:
-                    if isinstance(item, str):
-                        # Remote context URL
-                        if item not in remote_contexts:
-                            remote_contexts.append(item)
-                    elif isinstance(item, dict):
-                        # Local context object - merge carefully
-                        for key, value in item.items():
-                            if key not in merged_context:
-                                merged_context[key] = value
-                            elif merged_context[key] != value:
-                                # Context conflict - use prefixed version
-                                class_name = model_class.__name__.lower()
-                                merged_context[f"{class_name}_{key}"] = value
-            elif isinstance(context, dict):
-                # Single context object
-                for key, value in context.items():
-                    if key not in merged_context:
-                        merged_context[key] = value
-                    elif merged_context[key] != value:
-                        # Context conflict - use prefixed version
-                        class_name = model_class.__name__.lower()
-                        merged_context[f"{class_name}_{key}"] = value
+            context = model_class.export_context()["@context"]
+        else:
+            continue
+        
+        class_name = model_class.__name__.lower()
+        if isinstance(context, list):
+            # Handle array contexts
+            for item in context:
+                if isinstance(item, str):
+                    # Remote context URL
+                    if item not in remote_contexts:
+                        remote_contexts.append(item)
+                elif isinstance(item, dict):
+                    _merge_local_context(merged_context, item, class_name)
+        elif isinstance(context, dict):
+            # Single context object
+            _merge_local_context(merged_context, context, class_name)
     
     # Build final context
     if remote_contexts:
@@ -311,9 +295,9 @@ def export_mixed_graph(
     # Build graph items
     graph_items = []
     for model in models:
-        if hasattr(model, 'model_dump'):
-            # Pydantic model
-            item_data = model.model_dump(by_alias=True)
+        if hasattr(model, '__pydantic_serializer__'):
+            # Pydantic model - serialize with its compiled serializer
+            item_data = model.__pydantic_serializer__.to_python(model, by_alias=True)
         else:
             # Fallback for non-Pydantic models
             item_data = dict(model) if hasattr(model, '__iter__') else model
@@ -332,4 +316,37 @@ def export_mixed_graph(
     if metadata:
         graph_doc.update(metadata)
     
-    return graph_doc
\ No newline at end of file
+    return graph_doc
+
+
+def _merge_local_context(
+    merged_context: Dict[str, Any],
+    local_context: Dict[str, Any],
+    class_name: str
+) -> None:
+    """
+    Merge one model's local context object into a mixed-graph context.
+    
+    Keys already mapped to a different value are added as
+    "<class_name>_<key>" instead of overwriting the existing definition.
+    
+    Args:
+        merged_context: The context being built, updated in place
+        local_context: Local context object of one model class
+        class_name: Lower-cased model class name used to prefix conflicts
+    """
+    conflicts = {
+        key for key in merged_context.keys() & local_context.keys()
+        if merged_context[key] != local_context[key]
+    }
+    if not conflicts:
+        # Common case: new keys and identical shared definitions
+        merged_context.update(local_context)
+        return
+    
+    for key, value in local_context.items():
+        if key in conflicts:
+            # Context conflict - use prefixed version
+            merged_context[f"{class_name}_{key}"] = value
+        elif key not in merged_context:
+            merged_context[key] = value
@@ -2,30 +2,218 @@
 Core models and field helpers for JSON-LD context generation.
 """
 
-from typing import Any, Dict, List, Optional, Type, Union
+import sys
+import time
+import types
+from string import Formatter
+from types import MappingProxyType
+from typing import (
+    Any, BinaryIO, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type, Union,
+    get_args, get_origin,
+)
 from pydantic import BaseModel, ConfigDict
 from pydantic.fields import FieldInfo
+from pydantic.functional_serializers import PlainSerializer, WrapSerializer
+from pydantic_core import to_json
 from .validation import validate_context
 
 
-_JSONLD_META_KEY = "__jsonld__"
+# JSON-LD keywords used as keys in every exported document. Strings starting
+# with "@" are not interned automatically, so intern them once here and use
+# these constants in the builders below; key lookups on the resulting dicts
+# then succeed on the identity check instead of comparing characters.
+_CONTEXT = sys.intern("@context")
+_ID = sys.intern("@id")
+_TYPE = sys.intern("@type")
+_GRAPH = sys.intern("@graph")
+_CONTAINER = sys.intern("@container")
+_LANGUAGE = sys.intern("@language")
+_DATASET = sys.intern("Dataset")
+
+# Read-only prefix maps keyed by their items. Models configured with the same
+# vocabularies (the usual case) share a single mapping instead of each
+# holding its own dict.
+_prefix_cache: Dict[Tuple[Tuple[str, Any], ...], Mapping[str, Any]] = {}
+
+
+def _intern_prefixes(prefixes: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Return a shared read-only mapping equal to ``prefixes``.
+    
+    Args:
+        prefixes: Dictionary of prefix mappings
+        
+    Returns:
+        Read-only mapping shared by every model configured with the same prefixes
+    """
+    key = tuple(prefixes.items())
+    try:
+        interned = _prefix_cache.get(key)
+    except TypeError:
+        # Unhashable values can't be interned; keep a private read-only copy
+        return MappingProxyType(dict(prefixes))
+    if interned is None:
+        interned = _prefix_cache[key] = MappingProxyType(dict(prefixes))
+    return interned
+
+
+def _copy_jsonld(value: Any) -> Any:
+    """
+    Copy the dict/list structure of a JSON-LD value, sharing the leaf values.
+    
+    Cached artifacts are handed out through this so callers can mutate what
+    they receive without corrupting the cache.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_jsonld(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_jsonld(item) for item in value]
+    return value
 
 
 class JsonLDFieldInfo(FieldInfo):
     """Extended FieldInfo that can store JSON-LD metadata."""
     
+    # FieldInfo is slotted, so declaring our one extra attribute keeps
+    # instances free of a per-field __dict__.
+    __slots__ = ("jsonld_meta",)
+    
     def __init__(self, jsonld_meta: Dict[str, Any], **kwargs: Any):
-        # Store in both places for compatibility
-        metadata = kwargs.get('metadata', {})
-        if not isinstance(metadata, dict):
-            metadata = {}
-        metadata[_JSONLD_META_KEY] = jsonld_meta
-        kwargs['metadata'] = metadata
-        
+        # Pydantic v2 keeps FieldInfo.metadata as a list of constraint objects
+        # and ignores a `metadata` kwarg, so the JSON-LD metadata lives only in
+        # its own slot, where readers get it with a plain attribute load.
         super().__init__(**kwargs)
         self.jsonld_meta = jsonld_meta
 
 
+class _JsonLDField(NamedTuple):
+    """JSON-LD view of one annotated model field."""
+    
+    name: str
+    term: str
+    iri: str
+    type_: Optional[str]
+    container: Optional[str]
+    language: Optional[str]
+    field_info: FieldInfo
+    jsonld_meta: Dict[str, Any]
+    # Bitmask of the optional term properties that are set (_HAS_* below)
+    flags: int
+
+
+_HAS_TYPE = 1
+_HAS_CONTAINER = 2
+_HAS_LANGUAGE = 4
+
+
+def _jsonld_field_table(model_class: Type[BaseModel]) -> Tuple[_JsonLDField, ...]:
+    """
+    Return the JSON-LD annotated fields of a model class.
+    
+    The table is built on first use and stored on the class itself, so the
+    context and SHACL exporters don't re-walk model_fields on every call.
+    Fields are fixed once the class is created, so it never needs invalidating.
+    
+    Args:
+        model_class: The Pydantic model class to inspect
+        
+    Returns:
+        Tuple of annotated fields in definition order
+    """
+    table = model_class.__dict__.get("_jsonld_fields")
+    if table is None:
+        fields = []
+        for field_name, field_info in model_class.model_fields.items():
+            jsonld_meta = getattr(field_info, 'jsonld_meta', None)
+            if not jsonld_meta:
+                continue
+            type_ = jsonld_meta.get("type")
+            container = jsonld_meta.get("container")
+            language = jsonld_meta.get("language")
+            fields.append(_JsonLDField(
+                name=field_name,
+                # Use alias if available, otherwise field name
+                term=field_info.alias or field_name,
+                iri=jsonld_meta["iri"],
+                type_=type_,
+                container=container,
+                language=language,
+                field_info=field_info,
+                jsonld_meta=jsonld_meta,
+                flags=(
+                    (_HAS_TYPE if type_ else 0)
+                    | (_HAS_CONTAINER if container else 0)
+                    | (_HAS_LANGUAGE if language else 0)
+                ),
+            ))
+        table = tuple(fields)
+        model_class._jsonld_fields = table
+    return table
+
+
+# Types whose Python-mode serialization is the stored value itself
+_PLAIN_TYPES = (str, int, float, bool)
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def _plain_field_kind(annotation: Any) -> Optional[str]:
+    """
+    Classify a field annotation for the generated graph serializer.
+    
+    Returns:
+        "value" for plain scalars (optionally Optional), "list" for lists of
+        them, "optional_list" for Optional lists, or None if the field needs
+        pydantic's serializer
+    """
+    if annotation in _PLAIN_TYPES:
+        return "value"
+    
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_TYPES:
+        if len(args) != 2 or type(None) not in args:
+            return None
+        inner = args[0] if args[1] is type(None) else args[1]
+        kind = _plain_field_kind(inner)
+        if kind == "value":
+            return "value"
+        if kind == "list":
+            return "optional_list"
+        return None
+    if origin is list and len(args) == 1 and args[0] in _PLAIN_TYPES:
+        return "list"
+    return None
+
+
+def _compile_id_pattern(pattern: str) -> Callable[[int, Dict[str, Any]], str]:
+    """
+    Compile an auto-ID pattern into a function of (index, item_data).
+    
+    The common case of a single bare "{index}" field is split once into a
+    literal prefix and suffix so each ID is a plain concatenation. Any other
+    pattern falls back to str.format() with the item's data.
+    
+    Args:
+        pattern: Pattern such as "item-{index}"
+        
+    Returns:
+        Function producing the @id for a 1-based index and the item's data
+    """
+    try:
+        parsed = list(Formatter().parse(pattern))
+    except ValueError:
+        parsed = []
+    
+    fields = [(name, spec, conversion) for _, name, spec, conversion in parsed if name is not None]
+    if fields == [("index", "", None)]:
+        split = next(i for i, part in enumerate(parsed) if part[1] is not None)
+        prefix = "".join(part[0] for part in parsed[:split + 1])
+        suffix = "".join(part[0] for part in parsed[split + 1:])
+        return lambda index, item_data: f"{prefix}{index}{suffix}"
+    
+    return lambda index, item_data: pattern.format(index=index, **item_data)
+
+
 def Term(
     iri: str,
     type_: Optional[str] = None,
@@ -73,7 +261,6 @@ class JsonLDModel(BaseModel):
         arbitrary_types_allowed=True,
     )
     
-    
     @classmethod
     def configure_jsonld(
         cls,
@@ -98,16 +285,65 @@ class JsonLDModel(BaseModel):
         if remote_contexts is not None:
             cls._json_ld_remote_contexts = remote_contexts
         if prefixes is not None:
-            cls._json_ld_prefixes = prefixes
+            cls._json_ld_prefixes = _intern_prefixes(prefixes)
+        
+        cls._context_cache_entry = None
+        cls._shacl_cache_entry = None
     
     @classmethod
     def export_context(cls) -> Dict[str, Any]:
         """
         Export JSON-LD context for this model.
         
+        The context is built and validated once per configuration and cached;
+        each call returns a fresh copy that is safe to modify.
+        
         Returns:
             Dictionary containing the @context for this model
         """
+        return {_CONTEXT: _copy_jsonld(cls._cached_context())}
+    
+    @classmethod
+    def _context_config_key(cls) -> Tuple[Any, ...]:
+        """
+        Snapshot of the JSON-LD settings that the built context depends on.
+        """
+        prefixes = getattr(cls, '_json_ld_prefixes', None) or {}
+        return (
+            getattr(cls, '_json_ld_base', None),
+            getattr(cls, '_json_ld_vocab', None),
+            tuple(getattr(cls, '_json_ld_remote_contexts', None) or ()),
+            tuple(prefixes.items()),
+        )
+    
+    @classmethod
+    def _cached_context(cls) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Return the validated @context value for this model, building it on first use.
+        
+        The returned object is shared between callers and must not be mutated.
+        It is stored on the class itself (not inherited) together with the
+        configuration key it was built from, so that later configure_jsonld()
+        calls on the class or on a parent it inherits settings from trigger
+        a rebuild, and the cache goes away with the class.
+        """
+        key = cls._context_config_key()
+        cached = cls.__dict__.get("_context_cache_entry")
+        if cached is None or cached[0] != key:
+            context = cls._build_context()
+            
+            # Validate the context before caching it
+            validate_context({"@context": context})
+            
+            cached = (key, context)
+            cls._context_cache_entry = cached
+        return cached[1]
+    
+    @classmethod
+    def _build_context(cls) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Build the @context value for this model from its fields and settings.
+        """
         # Start with local context object
         local_context: Dict[str, Any] = {}
         
@@ -121,32 +357,29 @@ class JsonLDModel(BaseModel):
         if hasattr(cls, '_json_ld_prefixes') and cls._json_ld_prefixes:
             local_context.update(cls._json_ld_prefixes)
         
-        # Process model fields to build term mappings
-        for field_name, field_info in cls.model_fields.items():
-            # Get JSON-LD metadata from field
-            jsonld_meta = getattr(field_info, 'jsonld_meta', None)
-            if not jsonld_meta:
-                continue
-                
-            # Use alias if available, otherwise field name
-            term_name = field_info.alias or field_name
-            
+        # Process annotated fields to build term mappings
+        for field in _jsonld_field_table(cls):
             # Skip JSON-LD keywords - they shouldn't be redefined in context
-            if term_name.startswith("@"):
+            if field.term.startswith("@"):
                 continue
             
-            # Build term definition
-            term_def: Dict[str, Any] = {"@id": jsonld_meta["iri"]}
-            
-            # Add optional properties
-            if jsonld_meta.get("type"):
-                term_def["@type"] = jsonld_meta["type"]
-            if jsonld_meta.get("container"):
-                term_def["@container"] = jsonld_meta["container"]
-            if jsonld_meta.get("language"):
-                term_def["@language"] = jsonld_meta["language"]
+            # Build term definition, handling the common shapes (plain IRI,
+            # IRI plus @type) without testing each optional property
+            flags = field.flags
+            if not flags:
+                term_def: Dict[str, Any] = {_ID: field.iri}
+            elif flags == _HAS_TYPE:
+                term_def = {_ID: field.iri, _TYPE: field.type_}
+            else:
+                term_def = {_ID: field.iri}
+                if flags & _HAS_TYPE:
+                    term_def[_TYPE] = field.type_
+                if flags & _HAS_CONTAINER:
+                    term_def[_CONTAINER] = field.container
+                if flags & _HAS_LANGUAGE:
+                    term_def[_LANGUAGE] = field.language
             
-            local_context[term_name] = term_def
+            local_context[field.term] = term_def
         
         # Build final context structure
         if hasattr(cls, '_json_ld_remote_contexts') and cls._json_ld_remote_contexts:
@@ -156,24 +389,129 @@ class JsonLDModel(BaseModel):
             # Single local context
             context = local_context
         
-        result = {"@context": context}
-        
-        # Validate the context before returning
-        validate_context(result)
-        
-        return result
+        return context
     
     @classmethod
     def export_shacl(cls) -> Dict[str, Any]:
         """
         Export SHACL shape for this model.
         
+        The shapes document is built once per configuration and cached; each
+        call returns a fresh copy that is safe to modify.
+        
         Returns:
             Dictionary containing SHACL shape definition
         """
-        # This will be implemented in a separate file
-        from .exporters import export_shacl
-        return export_shacl(cls)
+        key = cls._context_config_key()
+        cached = cls.__dict__.get("_shacl_cache_entry")
+        if cached is None or cached[0] != key:
+            from .exporters import export_shacl
+            cached = (key, export_shacl(cls))
+            cls._shacl_cache_entry = cached
+        return _copy_jsonld(cached[1])
+    
+    @classmethod
+    def _jsonld_dumper(cls) -> Callable[[BaseModel], Dict[str, Any]]:
+        """
+        Return the function export_graph uses to turn an instance into a graph item.
+        
+        Compiled on first use and stored on the class.
+        """
+        dumper = cls.__dict__.get("_fast_to_dict")
+        if dumper is None:
+            dumper = cls._compile_jsonld_serializer()
+            cls._fast_to_dict = dumper
+        return dumper
+    
+    @classmethod
+    def _compile_jsonld_serializer(cls) -> Callable[[BaseModel], Dict[str, Any]]:
+        """
+        Generate a by-alias dump function specialized to this model's fields.
+        
+        Models made only of plain scalar fields (and lists or Optionals of
+        them) get a function that builds the item dict straight from the
+        instance __dict__ with the field-to-alias mapping baked in, which is
+        exactly what pydantic would produce for them. Anything that could
+        serialize differently - custom serializers, computed fields, excluded
+        fields, extra fields, nested models - uses pydantic's serializer.
+        """
+        serializer = cls.__pydantic_serializer__
+        
+        def fallback(instance: BaseModel) -> Dict[str, Any]:
+            return serializer.to_python(instance, by_alias=True)
+        
+        decorators = cls.__pydantic_decorators__
+        if (
+            decorators.field_serializers
+            or decorators.model_serializers
+            or cls.model_computed_fields
+            or cls.model_config.get("extra") == "allow"
+        ):
+            return fallback
+        
+        entries = []
+        for field_name, field_info in cls.model_fields.items():
+            kind = _plain_field_kind(field_info.annotation)
+            if (
+                kind is None
+                or field_info.exclude
+                or any(isinstance(m, (PlainSerializer, WrapSerializer)) for m in field_info.metadata)
+            ):
+                return fallback
+            
+            key = repr(field_info.serialization_alias or field_name)
+            value = f"values[{field_name!r}]"
+            if kind == "list":
+                value = f"list({value})"
+            elif kind == "optional_list":
+                value = f"(None if {value} is None else list({value}))"
+            entries.append(f"{key}: {value}")
+        
+        # Instances from model_construct() may lack fields; pydantic's
+        # serializer leaves those out, so defer to it when a key is missing
+        source = (
+            "def _fast_to_dict(instance):\n"
+            "    values = instance.__dict__\n"
+            "    try:\n"
+            f"        return {{{', '.join(entries)}}}\n"
+            "    except KeyError:\n"
+            "        return fallback(instance)\n"
+        )
+        namespace: Dict[str, Any] = {"fallback": fallback}
+        exec(compile(source, f"<jsonld serializer for {cls.__qualname__}>", "exec"), namespace)
+        return namespace["_fast_to_dict"]
+    
+    @classmethod
+    def _graph_dumpers(
+        cls, instances: List["JsonLDModel"]
+    ) -> Dict[type, Callable[[BaseModel], Dict[str, Any]]]:
+        """
+        Check the instances for a graph export and return a dumper per instance type.
+        
+        Raises:
+            ValueError: If instances is empty or contains foreign types
+        """
+        if not instances:
+            raise ValueError("Cannot create graph from empty instances list")
+        
+        # Validate all instances are of the same type as this class, checking
+        # each distinct type once rather than every instance
+        dumpers = {}
+        for instance_type in dict.fromkeys(map(type, instances)):
+            if instance_type is not cls and not issubclass(instance_type, cls):
+                raise ValueError(f"All instances must be of type {cls.__name__}, got {instance_type.__name__}")
+            dumpers[instance_type] = instance_type._jsonld_dumper()
+        return dumpers
+    
+    @classmethod
+    def _default_graph_id(cls) -> str:
+        """
+        Generate a graph ID from the class name and the current time.
+        
+        Uses a nanosecond timestamp, which is cheap to produce and keeps IDs
+        from successive exports distinct.
+        """
+        return f"{cls.__name__}-graph-{time.time_ns()}"
     
     @classmethod
     def export_graph(
@@ -195,56 +533,136 @@ class JsonLDModel(BaseModel):
         Returns:
             Dictionary containing JSON-LD document with @graph structure
         """
-        if not instances:
-            raise ValueError("Cannot create graph from empty instances list")
-        
-        # Validate all instances are of the same type as this class
-        for instance in instances:
-            if not isinstance(instance, cls):
-                raise ValueError(f"All instances must be of type {cls.__name__}, got {type(instance).__name__}")
+        dumpers = cls._graph_dumpers(instances)
         
         # Generate graph ID if not provided
         if graph_id is None:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            graph_id = f"{cls.__name__}-graph-{timestamp}"
-        
-        # Get the context from the class
-        context_doc = cls.export_context()
-        context = context_doc["@context"]
-        
-        # Build the graph items
-        graph_items = []
-        for i, instance in enumerate(instances):
-            # Get instance data with aliases
-            item_data = instance.model_dump(by_alias=True)
-            
-            # Auto-generate @id if not present and pattern provided
-            if "@id" not in item_data and auto_id_pattern:
-                item_data["@id"] = auto_id_pattern.format(index=i+1, **item_data)
-            
-            graph_items.append(item_data)
+            graph_id = cls._default_graph_id()
+        
+        # Copy the class's cached context, which was validated when it was built
+        context = _copy_jsonld(cls._cached_context())
+        
+        # Parse the auto-ID pattern once rather than once per instance
+        make_id = _compile_id_pattern(auto_id_pattern) if auto_id_pattern else None
+        
+        # Build the graph items with the specialized dumpers; the instances are
+        # already validated, so nothing is re-checked
+        if len(dumpers) == 1:
+            dump = next(iter(dumpers.values()))
+            graph_items = [dump(instance) for instance in instances]
+        else:
+            graph_items = [dumpers[type(instance)](instance) for instance in instances]
+        
+        # Auto-generate @id for items without one if a pattern was provided
+        if make_id:
+            for index, item_data in enumerate(graph_items, 1):
+                if _ID not in item_data:
+                    item_data[_ID] = make_id(index, item_data)
         
         # Build the graph document
         graph_doc: Dict[str, Any] = {
-            "@context": context,
-            "@id": graph_id,
-            "@type": "Dataset",
-            "@graph": graph_items
+            _CONTEXT: context,
+            _ID: graph_id,
+            _TYPE: _DATASET,
+            _GRAPH: graph_items
         }
         
         # Add metadata if provided
         if metadata:
             graph_doc.update(metadata)
         
-        # Validate the result if we have pyld available
-        try:
-            from .validation import validate_context
-            validate_context({"@context": context})
-        except ImportError:
-            pass  # Validation is optional
-        
         return graph_doc
+    
+    @classmethod
+    def export_graph_json(
+        cls,
+        instances: List["JsonLDModel"],
+        graph_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        auto_id_pattern: Optional[str] = None
+    ) -> bytes:
+        """
+        Export multiple model instances as a named JSON-LD graph serialized to JSON.
+        
+        Takes the same arguments as export_graph(), but encodes the document
+        with pydantic-core's serializer rather than the stdlib json module,
+        which is considerably faster for large graphs.
+        
+        Returns:
+            UTF-8 encoded JSON document with @graph structure
+        """
+        graph_doc = cls.export_graph(
+            instances,
+            graph_id=graph_id,
+            metadata=metadata,
+            auto_id_pattern=auto_id_pattern,
+        )
+        return to_json(graph_doc)
+    
+    @classmethod
+    def stream_graph_json(
+        cls,
+        instances: List["JsonLDModel"],
+        fp: BinaryIO,
+        graph_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        auto_id_pattern: Optional[str] = None
+    ) -> None:
+        """
+        Write multiple model instances as a named JSON-LD graph to a binary file.
+        
+        Produces the same bytes as export_graph_json(), but serializes and
+        writes one @graph item at a time, so neither the full graph document
+        nor its encoded form is ever held in memory. Use this for very large
+        graphs.
+        
+        Args:
+            instances: List of model instances to include in the graph
+            fp: Binary file-like object to write the JSON document to
+            graph_id: IRI for the named graph. If None, generates one based on class name
+            metadata: Optional metadata to include at graph level (created, source, etc.)
+            auto_id_pattern: Pattern for auto-generating @id values (e.g., "item-{index}")
+        """
+        dumpers = cls._graph_dumpers(instances)
+        
+        if graph_id is None:
+            graph_id = cls._default_graph_id()
+        
+        make_id = _compile_id_pattern(auto_id_pattern) if auto_id_pattern else None
+        
+        # Lay out the top-level keys exactly as export_graph() does, with a
+        # placeholder marking where the streamed items go
+        items_placeholder: List[Any] = []
+        graph_doc: Dict[str, Any] = {
+            _CONTEXT: cls._cached_context(),
+            _ID: graph_id,
+            _TYPE: _DATASET,
+            _GRAPH: items_placeholder
+        }
+        if metadata:
+            graph_doc.update(metadata)
+        
+        write = fp.write
+        write(b"{")
+        for position, (key, value) in enumerate(graph_doc.items()):
+            if position:
+                write(b",")
+            write(to_json(key))
+            write(b":")
+            if value is not items_placeholder:
+                write(to_json(value))
+                continue
+            
+            write(b"[")
+            for index, instance in enumerate(instances, 1):
+                item_data = dumpers[type(instance)](instance)
+                if make_id and _ID not in item_data:
+                    item_data[_ID] = make_id(index, item_data)
+                if index > 1:
+                    write(b",")
+                write(to_json(item_data))
+            write(b"]")
+        write(b"}")
 
 
 class SignableJsonLDModel(JsonLDModel):
@@ -277,37 +695,102 @@ class SignableJsonLDModel(JsonLDModel):
             ValueError: If signing fails
         """
         from .signatures import sign_jsonld_document
-        from .crypto_utils import private_key_from_bytes
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
         
-        # Convert bytes to private key if needed
-        if isinstance(private_key, bytes):
-            private_key = private_key_from_bytes(private_key)
-        elif not isinstance(private_key, Ed25519PrivateKey):
-            raise ValueError("private_key must be Ed25519PrivateKey or 32-byte bytes")
-        
-        # Export model as JSON-LD
-        context_doc = self.export_context()
-        context = context_doc["@context"]
-        
-        # Get model data with aliases
-        model_data = self.model_dump(by_alias=True)
-        
-        # Create JSON-LD document
-        document = {
-            "@context": context,
-            **model_data
-        }
+        private_key = self._coerce_private_key(private_key)
         
         # Sign the document
         return sign_jsonld_document(
-            document, 
+            self._jsonld_document(), 
             private_key, 
             verification_method, 
             created, 
             proof_purpose
         )
     
+    @classmethod
+    def sign_many(
+        cls,
+        instances: List["SignableJsonLDModel"],
+        private_key,
+        verification_method: Optional[str] = None,
+        created: Optional[str] = None,
+        proof_purpose: str = "assertionMethod"
+    ) -> List[Dict[str, Any]]:
+        """
+        Sign several model instances with the same key.
+        
+        Equivalent to calling sign() on each instance, except that the key
+        is converted, the verification method derived and the creation
+        timestamp taken once, so every proof in the batch shares them.
+        
+        Args:
+            instances: Model instances to sign
+            private_key: Ed25519PrivateKey instance or raw bytes
+            verification_method: Key identifier, auto-generated if None
+            created: ISO 8601 timestamp, defaults to current time
+            proof_purpose: Purpose of the proof
+            
+        Returns:
+            Signed JSON-LD documents, in the same order as instances
+            
+        Raises:
+            ValueError: If signing fails
+        """
+        from .signatures import _utc_timestamp, sign_jsonld_document
+        from .crypto_utils import generate_key_id
+        
+        private_key = cls._coerce_private_key(private_key)
+        if verification_method is None:
+            verification_method = generate_key_id(private_key.public_key())
+        if created is None:
+            created = _utc_timestamp()
+        
+        return [
+            sign_jsonld_document(
+                instance._jsonld_document(),
+                private_key,
+                verification_method,
+                created,
+                proof_purpose
+            )
+            for instance in instances
+        ]
+    
+    def _jsonld_document(self) -> Dict[str, Any]:
+        """
+        Build the unsigned JSON-LD document for this instance.
+        
+        The @context is the class's cached context, shared rather than
+        copied; sign_jsonld_document() copies the whole document before
+        adding the proof, so it is never modified.
+        """
+        # Get model data with aliases
+        model_data = type(self)._jsonld_dumper()(self)
+        
+        # Create JSON-LD document
+        return {
+            _CONTEXT: self._cached_context(),
+            **model_data
+        }
+    
+    @staticmethod
+    def _coerce_private_key(private_key):
+        """
+        Accept an Ed25519PrivateKey or its raw 32-byte form.
+        
+        Raises:
+            ValueError: If private_key is neither
+        """
+        from .crypto_utils import private_key_from_bytes
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+        
+        # Convert bytes to private key if needed
+        if isinstance(private_key, bytes):
+            return private_key_from_bytes(private_key)
+        if not isinstance(private_key, Ed25519PrivateKey):
+            raise ValueError("private_key must be Ed25519PrivateKey or 32-byte bytes")
+        return private_key
+    
     @classmethod
     def verify(
         cls, 
@@ -341,23 +824,22 @@ class SignableJsonLDModel(JsonLDModel):
         """
         Extract the original model data from a signed document.
         
+        The returned dict is a new top-level mapping, but nested values
+        (lists, objects) are shared with the signed document.
+        
         Args:
             signed_document: JSON-LD document with embedded proof
             
         Returns:
             Model data without proof or context
         """
-        from .signatures import remove_proof
-        
-        # Remove proof
-        doc_without_proof = remove_proof(signed_document)
-        
-        # Remove context
-        data = doc_without_proof.copy()
-        if "@context" in data:
-            del data["@context"]
-        
-        return data
+        # Single pass that drops the proof and context; keys are kept as-is
+        # (aliases included), so nothing needs re-serializing
+        return {
+            key: value
+            for key, value in signed_document.items()
+            if key != "proof" and key != _CONTEXT
+        }
     
     @classmethod
     def from_signed_document(cls, signed_document: Dict[str, Any]):
@@ -372,7 +854,9 @@ class SignableJsonLDModel(JsonLDModel):
             
         Note:
             This extracts the data and creates a new model instance.
-            The cryptographic proof is not preserved in the instance.
+            The cryptographic proof is not preserved in the instance, and
+            it is not checked either, so the data is validated as usual;
+            call verify() first for untrusted documents.
         """
         data = cls.extract_data(signed_document)
         return cls(**data)
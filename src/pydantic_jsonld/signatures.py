@@ -4,17 +4,52 @@ Core signing and verification functions for JSON-LD documents.
 Implements W3C Data Integrity specification with Ed25519Signature2020.
 """
 
-import base64
 import hashlib
 import json
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pyld
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from cryptography.exceptions import InvalidSignature
 
-from .crypto_utils import generate_key_id
+from .crypto_utils import b64decode_str, b64encode_str, generate_key_id
+
+
+# Proof suite produced and accepted by this module
+_PROOF_TYPE = "Ed25519Signature2020"
+
+# RDF conversion options, as pyld.jsonld.normalize() would use them
+_TO_RDF_OPTIONS = (('produceGeneralizedRdf', False),)
+
+# Larger documents are canonicalized without caching, so that no cache
+# entry pins an arbitrarily large document and its N-Quads
+_MAX_CACHED_DOCUMENT_LENGTH = 64 * 1024
+
+
+def _dumps(document: Any) -> str:
+    """
+    Serialize JSON data to compact text.
+    
+    All JSON encoding in this module goes through here. It stays on the
+    stdlib encoder on purpose: the text is used as a canonicalization
+    cache key and to deep-copy documents, so it must reject non-JSON values
+    and keep NaN distinct from null, which faster encoders such as orjson
+    or pydantic-core do not (they coerce dates to strings or NaN to null).
+    
+    Raises:
+        TypeError: If the document contains values that aren't JSON data
+        ValueError: If the document contains circular references
+    """
+    return json.dumps(document, separators=(',', ':'))
+
+
+def _copy_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep-copy a JSON-LD document through its JSON text.
+    """
+    return json.loads(_dumps(document))
 
 
 def canonicalize_jsonld(document: Dict[str, Any]) -> bytes:
@@ -30,15 +65,62 @@ def canonicalize_jsonld(document: Dict[str, Any]) -> bytes:
     Raises:
         ValueError: If document cannot be canonicalized
     """
+    # Remote contexts are resolved through the loader, so the result
+    # depends on it as well as on the document
+    loader = pyld.jsonld.get_document_loader()
     try:
-        # Use PyLD to normalize the document
-        canonical = pyld.jsonld.normalize(
-            document,
-            {
-                'algorithm': 'URDNA2015',
-                'format': 'application/n-quads'
-            }
-        )
+        document_json = _dumps(document)
+    except (TypeError, ValueError):
+        # Not plain JSON data, so it can't be cached by its text
+        return _normalize(document, loader, _TO_RDF_OPTIONS)
+    
+    if len(document_json) > _MAX_CACHED_DOCUMENT_LENGTH:
+        return _normalize(document, loader, _TO_RDF_OPTIONS)
+    
+    return _canonicalize_json(document_json, loader, _TO_RDF_OPTIONS)
+
+
+@lru_cache(maxsize=256)
+def _canonicalize_json(
+    document_json: str,
+    loader: Callable[..., Any],
+    options: Tuple[Tuple[str, Any], ...]
+) -> bytes:
+    """
+    Canonicalize a JSON-LD document given as JSON text, memoized.
+    
+    The cache key is the text together with the document loader and RDF
+    options used. Signing and then verifying a document canonicalizes
+    exactly the same content (the document with its proof minus
+    proofValue), so verification of a freshly signed document reuses the
+    signer's result rather than running URDNA2015 again.
+    """
+    return _normalize(json.loads(document_json), loader, options)
+
+
+def _normalize(
+    document: Dict[str, Any],
+    loader: Callable[..., Any],
+    options: Tuple[Tuple[str, Any], ...]
+) -> bytes:
+    """
+    Run URDNA2015 over a JSON-LD document and return N-Quads bytes.
+    
+    This does what pyld.jsonld.normalize() does - convert to an RDF dataset,
+    then canonicalize it - except that datasets without blank nodes skip the
+    canonical labelling step: with nothing to relabel, URDNA2015's output is
+    just the sorted N-Quads, which is what to_nquads() produces.
+    """
+    try:
+        # Convert to an RDF dataset with the given loader and options
+        dataset = pyld.jsonld.to_rdf(document, {**dict(options), 'documentLoader': loader})
+        
+        if _has_blank_nodes(dataset):
+            canonical = pyld.jsonld.URDNA2015().main(
+                dataset, {'format': 'application/n-quads'}
+            )
+        else:
+            canonical = pyld.jsonld.JsonLdProcessor.to_nquads(dataset)
         
         # Convert to bytes for hashing
         if isinstance(canonical, str):
@@ -50,6 +132,49 @@ def canonicalize_jsonld(document: Dict[str, Any]) -> bytes:
         raise ValueError(f"Failed to canonicalize JSON-LD document: {e}")
 
 
+def _has_blank_nodes(dataset: Dict[str, List[Dict[str, Any]]]) -> bool:
+    """
+    Check whether an RDF dataset from pyld's to_rdf() contains blank nodes.
+    """
+    for graph_name, triples in dataset.items():
+        if graph_name.startswith('_:'):
+            return True
+        for triple in triples:
+            if (
+                triple['subject']['type'] == 'blank node'
+                or triple['object']['type'] == 'blank node'
+            ):
+                return True
+    return False
+
+
+def _hash_canonical(canonical_bytes: bytes) -> bytes:
+    """
+    SHA-256 digest of canonical N-Quads, the message that gets signed.
+    
+    hashlib's sha256 is backed by OpenSSL, which uses the CPU's SHA
+    extensions where available; the digest is computed in a single call
+    over the already materialized canonical bytes.
+    
+    Ed25519 could sign the canonical bytes directly, but the signed message
+    is part of the proof format: every proofValue issued so far covers this
+    32-byte digest, so dropping the prehash would make all existing signed
+    documents fail verification.
+    """
+    return hashlib.sha256(canonical_bytes).digest()
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string with a 'Z' suffix.
+    
+    Formatted straight from time.gmtime() at second precision (the usual
+    form for proof timestamps), which avoids building an aware datetime
+    and post-processing its isoformat() output.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
 def create_proof_object(
     verification_method: str,
     created: Optional[str] = None,
@@ -67,10 +192,10 @@ def create_proof_object(
         Proof object without proofValue
     """
     if created is None:
-        created = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        created = _utc_timestamp()
     
     return {
-        "type": "Ed25519Signature2020",
+        "type": _PROOF_TYPE,
         "created": created,
         "verificationMethod": verification_method,
         "proofPurpose": proof_purpose
@@ -101,7 +226,7 @@ def sign_jsonld_document(
         ValueError: If signing fails
     """
     # Make a copy to avoid modifying original
-    doc_copy = json.loads(json.dumps(document))
+    doc_copy = _copy_document(document)
     
     # Remove any existing proof
     if "proof" in doc_copy:
@@ -124,13 +249,13 @@ def sign_jsonld_document(
         canonical_bytes = canonicalize_jsonld(doc_with_proof)
         
         # Hash the canonical representation
-        hash_digest = hashlib.sha256(canonical_bytes).digest()
+        hash_digest = _hash_canonical(canonical_bytes)
         
         # Sign the hash
         signature_bytes = private_key.sign(hash_digest)
         
         # Encode signature as base64
-        signature_b64 = base64.b64encode(signature_bytes).decode('ascii')
+        signature_b64 = b64encode_str(signature_bytes)
         
         # Add proofValue to proof
         proof["proofValue"] = signature_b64
@@ -164,7 +289,7 @@ def verify_jsonld_document(
         proof = signed_document["proof"]
         
         # Check proof type
-        if proof.get("type") != "Ed25519Signature2020":
+        if proof.get("type") != _PROOF_TYPE:
             return False
         
         # Extract signature
@@ -174,19 +299,20 @@ def verify_jsonld_document(
         signature_b64 = proof["proofValue"]
         
         try:
-            signature_bytes = base64.b64decode(signature_b64)
+            signature_bytes = b64decode_str(signature_b64)
         except Exception:
             return False
         
-        # Recreate document without proofValue
-        doc_copy = json.loads(json.dumps(signed_document))
-        proof_copy = doc_copy["proof"].copy()
+        # Recreate document without proofValue; canonicalization works from
+        # the serialized text, so a shallow copy is enough here
+        doc_copy = dict(signed_document)
+        proof_copy = dict(proof)
         del proof_copy["proofValue"]
         doc_copy["proof"] = proof_copy
         
         # Canonicalize and hash
         canonical_bytes = canonicalize_jsonld(doc_copy)
-        hash_digest = hashlib.sha256(canonical_bytes).digest()
+        hash_digest = _hash_canonical(canonical_bytes)
         
         # Verify signature
         try:
@@ -200,6 +326,29 @@ def verify_jsonld_document(
         return False
 
 
+def verify_jsonld_documents(
+    items: Iterable[Tuple[Dict[str, Any], Ed25519PublicKey]]
+) -> List[bool]:
+    """
+    Verify several signed JSON-LD documents.
+    
+    Each signature is checked independently, so one bad document doesn't
+    hide the result of the others. The cryptography package has no batch
+    (multi-scalar) Ed25519 verification, and canonicalization dominates
+    the cost of each check anyway.
+    
+    Args:
+        items: Pairs of (signed_document, public_key)
+        
+    Returns:
+        One result per item, in order: True if that signature is valid
+    """
+    return [
+        verify_jsonld_document(signed_document, public_key)
+        for signed_document, public_key in items
+    ]
+
+
 def extract_proof_metadata(signed_document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Extract proof metadata from a signed document.
@@ -223,17 +372,23 @@ def extract_proof_metadata(signed_document: Dict[str, Any]) -> Optional[Dict[str
     return metadata
 
 
-def remove_proof(signed_document: Dict[str, Any]) -> Dict[str, Any]:
+def remove_proof(signed_document: Dict[str, Any], copy: bool = False) -> Dict[str, Any]:
     """
     Remove proof from a signed document, returning the original data.
     
+    By default only the top level is new: nested values such as the
+    @context are shared with signed_document, so don't mutate them.
+    
     Args:
         signed_document: JSON-LD document with embedded proof
+        copy: If True, return a fully independent deep copy instead
         
     Returns:
         Document without proof
     """
-    doc_copy = json.loads(json.dumps(signed_document))
-    if "proof" in doc_copy:
-        del doc_copy["proof"]
-    return doc_copy
\ No newline at end of file
+    if copy:
+        doc_copy = _copy_document(signed_document)
+        doc_copy.pop("proof", None)
+        return doc_copy
+    
+    return {key: value for key, value in signed_document.items() if key != "proof"}
\ No newline at end of file
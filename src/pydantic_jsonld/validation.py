@@ -2,140 +2,320 @@
 JSON-LD context validation logic.
 """
 
-from typing import Any, Dict, List, Union
-from pydantic import BaseModel, ValidationError, field_validator
+import sys
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
+from pydantic import AnyUrl, BeforeValidator, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError
 
 
-class ContextTerm(BaseModel):
+class ErrorCode(str, Enum):
     """
-    Validates individual terms in a JSON-LD context.
+    Machine-readable codes for JSON-LD context validation errors.
+    
+    Each error is raised as a PydanticCustomError of type "jsonld" with the
+    code under the "code" key of its context, so callers can inspect
+    ``exc.errors()[0]["ctx"]["code"]`` instead of matching message text.
     """
     
-    term_definition: Dict[str, Any]
+    MISSING_ID = "missing_id"
+    UNKNOWN_KEYWORD = "unknown_keyword"
+    INVALID_TYPE = "invalid_type"
+    INVALID_CONTAINER = "invalid_container"
+    INVALID_LANGUAGE = "invalid_language"
+    INVALID_VERSION = "invalid_version"
+    INVALID_BASE = "invalid_base"
+    INVALID_VOCAB = "invalid_vocab"
+    INVALID_IMPORT = "invalid_import"
+    INVALID_PROTECTED = "invalid_protected"
+    INVALID_TERM_VALUE = "invalid_term_value"
+    INVALID_URL = "invalid_url"
+    INVALID_CONTEXT_TYPE = "invalid_context_type"
+
+
+def _error(code: ErrorCode, message: str, **context: Any) -> PydanticCustomError:
+    """
+    Build a JSON-LD validation error carrying a machine-readable code.
     
-    @field_validator("term_definition")
-    @classmethod
-    def validate_term_definition(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Validate that a term definition follows JSON-LD specifications.
-        """
-        if not isinstance(v, dict):
-            raise ValueError("Term definition must be a dictionary")
-        
-        # Check for required @id
-        if "@id" not in v:
-            raise ValueError("Term definition must have @id property")
-        
-        # Check for allowed JSON-LD keywords
-        allowed_keywords = {
-            "@id", "@type", "@language", "@container", "@context", 
-            "@reverse", "@nest", "@prefix", "@protected"
-        }
-        
-        unknown_keywords = set(v.keys()) - allowed_keywords
-        if unknown_keywords:
-            raise ValueError(f"Unknown JSON-LD keywords: {unknown_keywords}")
-        
-        # Validate @type values
-        if "@type" in v:
-            type_value = v["@type"]
-            if not isinstance(type_value, str):
-                raise ValueError("@type must be a string")
+    Args:
+        code: The error code
+        message: Message template; ``{name}`` placeholders are filled from context
+        **context: Values for the message template
         
-        # Validate @container values
-        if "@container" in v:
-            container_value = v["@container"]
-            valid_containers = {"@list", "@set", "@index", "@language", "@id", "@type"}
-            if isinstance(container_value, str):
-                if container_value not in valid_containers:
-                    raise ValueError(f"Invalid @container value: {container_value}")
-            elif isinstance(container_value, list):
-                for item in container_value:
-                    if item not in valid_containers:
-                        raise ValueError(f"Invalid @container value: {item}")
+    Returns:
+        The error, ready to be raised
+    """
+    return PydanticCustomError("jsonld", message, {"code": code, **context})
+
+
+# Keywords are interned, as in models.py, so the keys of generated contexts
+# and the constants below are the same objects and lookups succeed on the
+# identity check.
+_ID = sys.intern("@id")
+_TYPE = sys.intern("@type")
+_CONTAINER = sys.intern("@container")
+_LANGUAGE = sys.intern("@language")
+_CONTEXT = sys.intern("@context")
+
+# Keywords allowed inside an expanded term definition
+_KNOWN_KEYWORDS = frozenset(map(sys.intern, (
+    "@id", "@type", "@language", "@container", "@context",
+    "@reverse", "@nest", "@prefix", "@protected", "@index"
+)))
+
+# Allowed @container values
+_VALID_CONTAINERS = frozenset(map(sys.intern, (
+    "@list", "@set", "@index", "@language", "@id", "@type", "@graph"
+)))
+
+# Remote context URLs must be http(s) and are parsed by pydantic-core, all
+# of an array's at once. AnyUrl rather than HttpUrl, which would also cap
+# the length at 2083 characters.
+_URL_SCHEMES = ("http://", "https://")
+_URL_LIST_ADAPTER = TypeAdapter(List[AnyUrl])
+
+# Keywords that may appear as terms in a context object. @language is not
+# one of them: at the top of a context it sets the default language and is
+# checked as a keyword.
+_REDEFINABLE_KEYWORDS = frozenset(map(sys.intern, (
+    "@id", "@type", "@value", "@index", "@list", "@set",
+    "@reverse", "@graph", "@context"
+)))
+
+# Marks a missing key, so one .get() replaces an "in" check plus a lookup
+_MISSING = object()
+
+
+def _is_simple_term(v: Any) -> bool:
+    """
+    Recognize the two common term shapes that need no further checks.
+    
+    Most terms, including every one models.py generates without a
+    container or language, are {"@id": str} or {"@id": str, "@type": str}.
+    """
+    if type(v) is not dict:
+        return False
+    size = len(v)
+    if size == 1:
+        return type(v.get(_ID)) is str
+    if size == 2:
+        return type(v.get(_ID)) is str and type(v.get(_TYPE)) is str
+    return False
+
+
+def _check_term_definition(v: Dict[str, Any]) -> None:
+    """
+    Check that a term definition follows JSON-LD specifications.
+    
+    Raises:
+        PydanticCustomError: If the term definition is invalid
+    """
+    if _is_simple_term(v):
+        return
+    
+    if not isinstance(v, Mapping):
+        raise _error(ErrorCode.INVALID_TERM_VALUE, "Term definition must be a dictionary")
+    
+    # Check for required @id
+    if _ID not in v:
+        raise _error(ErrorCode.MISSING_ID, "Term definition must have @id property")
+    
+    # Check for allowed JSON-LD keywords
+    unknown_keywords = v.keys() - _KNOWN_KEYWORDS
+    if unknown_keywords:
+        raise _error(
+            ErrorCode.UNKNOWN_KEYWORD,
+            "Unknown JSON-LD keywords: {keywords}",
+            keywords=", ".join(sorted(map(str, unknown_keywords)))
+        )
+    
+    # Validate @type values
+    if _TYPE in v:
+        type_value = v[_TYPE]
+        if not isinstance(type_value, str):
+            raise _error(ErrorCode.INVALID_TYPE, "@type must be a string")
+    
+    # Validate @container values
+    if _CONTAINER in v:
+        container_value = v[_CONTAINER]
+        if isinstance(container_value, str):
+            if container_value not in _VALID_CONTAINERS:
+                raise _error(ErrorCode.INVALID_CONTAINER, "Invalid @container value: {value}", value=container_value)
+        elif isinstance(container_value, list):
+            for item in container_value:
+                if item not in _VALID_CONTAINERS:
+                    raise _error(ErrorCode.INVALID_CONTAINER, "Invalid @container value: {value}", value=item)
+        else:
+            raise _error(ErrorCode.INVALID_CONTAINER, "@container must be a string or list")
+    
+    # Validate @language values
+    if _LANGUAGE in v:
+        language_value = v[_LANGUAGE]
+        if not isinstance(language_value, str):
+            raise _error(ErrorCode.INVALID_LANGUAGE, "@language must be a string")
+
+
+def _validate_term_definition(v: Any) -> Any:
+    """
+    Validate that a term definition follows JSON-LD specifications.
+    """
+    _check_term_definition(v)
+    return v
+
+
+# Validates individual terms in a JSON-LD context:
+# ContextTerm.validate_python(term_definition) returns the definition
+ContextTerm = TypeAdapter(Annotated[Dict[str, Any], BeforeValidator(_validate_term_definition)])
+
+
+def _check_context(v: Union[Dict[str, Any], List[Union[Dict[str, Any], str]]]) -> None:
+    """
+    Check the structure of a @context value.
+    
+    Raises:
+        PydanticCustomError: If the context is invalid
+    """
+    # Exact type checks first, as in _check_context_object: plain dicts,
+    # lists and strings are the common case and skip the MRO walk.
+    context_type = type(v)
+    if context_type is dict:
+        # Single context object
+        _check_context_object(v)
+    elif context_type is list or (isinstance(v, Sequence) and not isinstance(v, (str, bytes))):
+        # Array context - validate each item, collecting remote context
+        # URLs so they can be parsed in a single call
+        urls = []
+        url_indices = []
+        for i, item in enumerate(v):
+            item_type = type(item)
+            if item_type is dict:
+                # Local context object
+                _check_context_object(item)
+            elif item_type is str or isinstance(item, str):
+                # Remote context URL
+                urls.append(item)
+                url_indices.append(i)
+            elif isinstance(item, Mapping):
+                _check_context_object(item)
             else:
-                raise ValueError("@container must be a string or list")
-        
-        # Validate @language values
-        if "@language" in v:
-            language_value = v["@language"]
-            if not isinstance(language_value, str):
-                raise ValueError("@language must be a string")
+                raise _error(ErrorCode.INVALID_CONTEXT_TYPE, "Context array item at index {index} must be string or dict", index=i)
+        if urls:
+            _check_remote_urls(urls, url_indices)
+    elif isinstance(v, Mapping):
+        _check_context_object(v)
+    else:
+        raise _error(ErrorCode.INVALID_CONTEXT_TYPE, "Context must be a dictionary or array")
+
+
+@lru_cache(maxsize=4096)
+def _first_invalid_url(urls: Tuple[str, ...]) -> Optional[int]:
+    """
+    Find the first invalid URL, memoized across contexts.
+    
+    Contexts built from different local definitions usually share the
+    same remote contexts, so the URL tuple repeats even when the
+    surrounding context does not.
+    
+    Returns:
+        Position of the first invalid URL, or None if all are valid
+    """
+    bad_scheme = next(
+        (position for position, url in enumerate(urls) if not url.startswith(_URL_SCHEMES)),
+        None
+    )
+    try:
+        _URL_LIST_ADAPTER.validate_python(urls)
+    except ValidationError as e:
+        unparsable = e.errors()[0]["loc"][0]
+        return unparsable if bad_scheme is None else min(unparsable, bad_scheme)
+    return bad_scheme
+
+
+def _check_remote_urls(urls: List[str], indices: List[int]) -> None:
+    """
+    Check remote context URLs taken from a context array.
+    
+    Args:
+        urls: The URLs, in array order
+        indices: Position of each URL in the context array
         
-        return v
-
-
-class JsonLDContext(BaseModel):
-    """
-    Validates a complete JSON-LD context structure.
-    """
-    
-    context: Union[Dict[str, Any], List[Union[Dict[str, Any], str]]]
-    
-    @field_validator("context")
-    @classmethod
-    def validate_context(cls, v: Union[Dict[str, Any], List[Union[Dict[str, Any], str]]]) -> Union[Dict[str, Any], List[Union[Dict[str, Any], str]]]:
-        """
-        Validate the context structure.
-        """
-        if isinstance(v, list):
-            # Array context - validate each item
-            for i, item in enumerate(v):
-                if isinstance(item, str):
-                    # Remote context URL - basic validation
-                    if not item.startswith(("http://", "https://")):
-                        raise ValueError(f"Remote context at index {i} must be a valid URL")
-                elif isinstance(item, dict):
-                    # Local context object
-                    cls._validate_context_object(item)
-                else:
-                    raise ValueError(f"Context array item at index {i} must be string or dict")
-        elif isinstance(v, dict):
-            # Single context object
-            cls._validate_context_object(v)
+    Raises:
+        PydanticCustomError: If any URL is invalid, naming the first one
+    """
+    invalid = _first_invalid_url(tuple(urls))
+    if invalid is not None:
+        raise _error(
+            ErrorCode.INVALID_URL,
+            "Remote context at index {index} must be a valid URL",
+            index=indices[invalid]
+        )
+
+
+def _check_context_object(context_obj: Dict[str, Any]) -> None:
+    """
+    Check a single context object.
+    
+    Raises:
+        PydanticCustomError: If the context object is invalid
+    """
+    for key, value in context_obj.items():
+        if not isinstance(key, str):
+            raise _error(ErrorCode.INVALID_TERM_VALUE, "Context key {key} must be a string", key=repr(key))
+        if key.startswith("@") and key not in _REDEFINABLE_KEYWORDS:
+            # JSON-LD keyword (but not terms that can be defined)
+            if key == "@version":
+                if not isinstance(value, (int, float)) or value != 1.1:
+                    raise _error(ErrorCode.INVALID_VERSION, "@version must be 1.1")
+            elif key == "@base":
+                if not isinstance(value, str):
+                    raise _error(ErrorCode.INVALID_BASE, "@base must be a string")
+            elif key == "@vocab":
+                if not isinstance(value, str):
+                    raise _error(ErrorCode.INVALID_VOCAB, "@vocab must be a string")
+            elif key == "@language":
+                if not isinstance(value, str):
+                    raise _error(ErrorCode.INVALID_LANGUAGE, "@language must be a string")
+            elif key == "@import":
+                if not isinstance(value, str):
+                    raise _error(ErrorCode.INVALID_IMPORT, "@import must be a string")
+            elif key == "@protected":
+                if not isinstance(value, bool):
+                    raise _error(ErrorCode.INVALID_PROTECTED, "@protected must be a boolean")
+            else:
+                raise _error(ErrorCode.UNKNOWN_KEYWORD, "Unknown JSON-LD keyword: {keyword}", keyword=key)
         else:
-            raise ValueError("Context must be a dictionary or array")
-        
-        return v
-    
-    @classmethod
-    def _validate_context_object(cls, context_obj: Dict[str, Any]) -> None:
-        """
-        Validate a single context object.
-        """
-        for key, value in context_obj.items():
-            if key.startswith("@") and key not in ["@id", "@type", "@value", "@language", "@index", "@list", "@set", "@reverse", "@graph", "@context"]:
-                # JSON-LD keyword (but not terms that can be defined)
-                if key == "@version":
-                    if not isinstance(value, (int, float)) or value != 1.1:
-                        raise ValueError("@version must be 1.1")
-                elif key == "@base":
-                    if not isinstance(value, str):
-                        raise ValueError("@base must be a string")
-                elif key == "@vocab":
-                    if not isinstance(value, str):
-                        raise ValueError("@vocab must be a string")
-                elif key == "@language":
-                    if not isinstance(value, str):
-                        raise ValueError("@language must be a string")
-                elif key == "@import":
-                    if not isinstance(value, str):
-                        raise ValueError("@import must be a string")
-                elif key == "@protected":
-                    if not isinstance(value, bool):
-                        raise ValueError("@protected must be a boolean")
-                else:
-                    raise ValueError(f"Unknown JSON-LD keyword: {key}")
+            # Term definition (including @id, @type, etc. which can be redefined)
+            # Exact type checks first: plain str/dict is the common case and
+            # skips the MRO walk; isinstance still admits subclasses
+            # and read-only mappings.
+            value_type = type(value)
+            if value_type is str or isinstance(value, str):
+                # Simple string mapping (IRI)
+                continue
+            elif value_type is dict or isinstance(value, Mapping):
+                # Complex term definition; checked directly so its error
+                # code reaches the caller
+                _check_term_definition(value)
             else:
-                # Term definition (including @id, @type, etc. which can be redefined)
-                if isinstance(value, str):
-                    # Simple string mapping (IRI)
-                    continue
-                elif isinstance(value, dict):
-                    # Complex term definition
-                    ContextTerm(term_definition=value)
-                else:
-                    raise ValueError(f"Term '{key}' must be string or dict")
+                raise _error(ErrorCode.INVALID_TERM_VALUE, "Term '{term}' must be string or dict", term=key)
+
+
+def _validate_context_value(v: Any) -> Any:
+    """
+    Validate the context structure.
+    """
+    _check_context(v)
+    return v
+
+
+# Validates a complete JSON-LD context structure:
+# JsonLDContext.validate_python(context) returns the context
+JsonLDContext = TypeAdapter(Annotated[
+    Union[Dict[str, Any], List[Union[Dict[str, Any], str]]],
+    BeforeValidator(_validate_context_value)
+])
 
 
 def validate_context(context_data: Dict[str, Any]) -> None:
@@ -146,12 +326,16 @@ def validate_context(context_data: Dict[str, Any]) -> None:
         context_data: The context document to validate
         
     Raises:
-        ValidationError: If the context is invalid
+        ValueError: If the context is invalid; the PydanticCustomError with
+            its error code is attached as ``__cause__``
     """
-    if "@context" not in context_data:
+    # Anything other than a mapping cannot hold a @context property
+    context = context_data.get(_CONTEXT, _MISSING) if isinstance(context_data, Mapping) else _MISSING
+    if context is _MISSING:
         raise ValueError("Document must have @context property")
     
     try:
-        JsonLDContext(context=context_data["@context"])
-    except ValidationError as e:
+        _validate_context_value(context)
+    except PydanticCustomError as e:
+        # The cause is the coded error itself, whose text is just its message
         raise ValueError(f"Invalid JSON-LD context: {e}") from e
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+
+from pydantic_jsonld import generate_ed25519_keypair
+from pydantic_jsonld.validation import ContextTerm, JsonLDContext
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_validators():
+    """Run each validator once so the first test isn't charged for setup."""
+    ContextTerm.validate_python({"@id": "x:y"})
+    JsonLDContext.validate_python({"a": "b:c"})
+
+
+@pytest.fixture(scope="session")
+def ed25519_keypair():
+    """Ed25519 (private_key, public_key) pair shared across the test session."""
+    return generate_ed25519_keypair()
+
+
+@pytest.fixture(scope="session")
+def alt_ed25519_keypair():
+    """A second, unrelated Ed25519 key pair for wrong-key tests."""
+    return generate_ed25519_keypair()
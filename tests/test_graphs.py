@@ -141,6 +141,16 @@ class TestSameModelGraphs:
         # Check auto-generated IDs
         assert graph["@graph"][0]["@id"] == "person-1"
         assert graph["@graph"][1]["@id"] == "person-2"
+        
+        # Patterns may also reference the item's own data
+        graph = PersonWithoutId.export_graph(
+            instances=people,
+            graph_id="test-auto-ids",
+            auto_id_pattern="{name}-{index:03d}"
+        )
+        
+        assert graph["@graph"][0]["@id"] == "Alice-001"
+        assert graph["@graph"][1]["@id"] == "Bob-002"
     
     def test_export_graph_empty_instances(self):
         """Test error handling for empty instances list."""
@@ -165,6 +175,55 @@ class TestSameModelGraphs:
         
         # Context should be the same
         assert graph["@context"] == class_context["@context"]
+    
+    def test_export_graph_context_is_independent(self):
+        """Test that modifying one graph's context does not affect later exports."""
+        people = [
+            PersonModel(identifier="person-1", name="Alice", age=30, skills=["Python"])
+        ]
+        
+        graph1 = PersonModel.export_graph(instances=people, graph_id="graph-1")
+        expected = PersonModel.export_context()["@context"]
+        graph1["@context"]["name"]["@id"] = "http://evil.example/x"
+        
+        graph2 = PersonModel.export_graph(instances=people, graph_id="graph-2")
+        assert graph2["@context"] == expected
+        assert PersonModel.export_context()["@context"] == expected
+    
+    def test_export_graph_items_match_model_dump(self):
+        """Test generated item serializers agree with pydantic's by-alias dump."""
+        from pydantic import field_serializer
+        
+        people = [
+            PersonModel(identifier="person-1", name="Alice", age=None, skills=["Python"])
+        ]
+        graph = PersonModel.export_graph(instances=people, graph_id="dump-test")
+        
+        assert graph["@graph"][0] == people[0].model_dump(by_alias=True)
+        # List values must be copies, not the instance's own lists
+        assert graph["@graph"][0]["skills"] is not people[0].skills
+        
+        class ShoutingModel(JsonLDModel):
+            name: str = Term("schema:name")
+            
+            @field_serializer("name")
+            def shout(self, value: str) -> str:
+                return value.upper()
+        
+        graph = ShoutingModel.export_graph(
+            instances=[ShoutingModel(name="alice")], graph_id="custom-serializer"
+        )
+        assert graph["@graph"][0]["name"] == "ALICE"
+    
+    def test_export_graph_partially_constructed_instance(self):
+        """Test instances missing fields serialize like pydantic's by-alias dump."""
+        person = PersonModel.model_construct(identifier="person-1", name="Alice")
+        
+        dump = PersonModel._jsonld_dumper()
+        assert dump(person) == person.model_dump(by_alias=True, warnings=False)
+        
+        graph = PersonModel.export_graph(instances=[person], graph_id="partial")
+        assert "skills" not in graph["@graph"][0]
 
 
 class TestMixedModelGraphs:
@@ -249,6 +308,32 @@ class TestMixedModelGraphs:
             assert any("age" in key for key in local_context.keys())
             assert any("price" in key for key in local_context.keys())
     
+    def test_export_mixed_graph_context_is_independent(self):
+        """Test that modifying a mixed graph's context does not affect the models."""
+        person = PersonModel(identifier="person-1", name="Alice", age=30, skills=["Python"])
+        expected = PersonModel.export_context()["@context"]
+        
+        graph = export_mixed_graph(models=[person], graph_id="independent-test")
+        graph["@context"]["age"]["@type"] = "xsd:string"
+        
+        assert PersonModel.export_context()["@context"] == expected
+    
+    def test_export_mixed_graph_context_conflicts(self):
+        """Test conflicting term definitions are kept under prefixed names."""
+        class Article(JsonLDModel):
+            name: str = Term("schema:headline")
+        
+        person = PersonModel(identifier="person-1", name="Alice", age=30, skills=["Python"])
+        article = Article(name="News")
+        
+        graph = export_mixed_graph(models=[person, article], graph_id="conflict-test")
+        context = graph["@context"]
+        
+        # First model seen keeps the plain term, the later one is prefixed
+        assert context["name"] == {"@id": "schema:name"}
+        assert context["article_name"] == {"@id": "schema:headline"}
+        assert context["age"] == {"@id": "schema:age", "@type": "xsd:integer"}
+    
     def test_export_mixed_graph_empty_models(self):
         """Test error handling for empty models list."""
         with pytest.raises(ValueError, match="Cannot create graph from empty models list"):
@@ -299,6 +384,40 @@ class TestGraphValidation:
         parsed = json.loads(json_str)
         assert parsed["@id"] == "serialization-test"
     
+    def test_export_graph_json(self):
+        """Test direct JSON export of graphs."""
+        import json
+        
+        people = [
+            PersonModel(identifier="person-1", name="Alice", age=30, skills=["Python"])
+        ]
+        
+        json_bytes = PersonModel.export_graph_json(instances=people, graph_id="json-test")
+        assert isinstance(json_bytes, bytes)
+        
+        # Should round-trip to the same document as export_graph
+        graph = PersonModel.export_graph(instances=people, graph_id="json-test")
+        assert json.loads(json_bytes) == graph
+    
+    def test_stream_graph_json(self):
+        """Test streaming graph export writes the same bytes as export_graph_json."""
+        import io
+        
+        people = [
+            PersonModel(identifier="person-1", name="Alice", age=30, skills=["Python"]),
+            PersonModel(identifier="person-2", name="Bob", age=None, skills=[])
+        ]
+        
+        buffer = io.BytesIO()
+        PersonModel.stream_graph_json(
+            people, buffer, graph_id="stream-test", metadata={"source": "tests"}
+        )
+        
+        expected = PersonModel.export_graph_json(
+            instances=people, graph_id="stream-test", metadata={"source": "tests"}
+        )
+        assert buffer.getvalue() == expected
+    
     def test_large_graph_performance(self):
         """Test performance with larger graphs."""
         # Create 100 people
@@ -15,33 +15,40 @@ class TestTerm:
     def test_term_basic(self):
         """Test basic Term usage."""
         field = Term("schema:name")
-        assert field.metadata["__jsonld__"]["iri"] == "schema:name"
-        assert field.metadata["__jsonld__"]["type"] is None
-        assert field.metadata["__jsonld__"]["container"] is None
-        assert field.metadata["__jsonld__"]["language"] is None
+        assert field.jsonld_meta["iri"] == "schema:name"
+        assert field.jsonld_meta["type"] is None
+        assert field.jsonld_meta["container"] is None
+        assert field.jsonld_meta["language"] is None
     
     def test_term_with_type(self):
         """Test Term with type annotation."""
         field = Term("schema:name", type_="xsd:string")
-        assert field.metadata["__jsonld__"]["iri"] == "schema:name"
-        assert field.metadata["__jsonld__"]["type"] == "xsd:string"
+        assert field.jsonld_meta["iri"] == "schema:name"
+        assert field.jsonld_meta["type"] == "xsd:string"
     
     def test_term_with_container(self):
         """Test Term with container annotation."""
         field = Term("schema:keywords", container="@set")
-        assert field.metadata["__jsonld__"]["container"] == "@set"
+        assert field.jsonld_meta["container"] == "@set"
     
     def test_term_with_language(self):
         """Test Term with language annotation."""
         field = Term("schema:name", language="en")
-        assert field.metadata["__jsonld__"]["language"] == "en"
+        assert field.jsonld_meta["language"] == "en"
     
     def test_term_with_field_kwargs(self):
         """Test Term with additional field kwargs."""
         field = Term("schema:name", description="The name field", default="test")
-        assert field.metadata["__jsonld__"]["iri"] == "schema:name"
+        assert field.jsonld_meta["iri"] == "schema:name"
         assert field.description == "The name field"
         assert field.default == "test"
+    
+    def test_term_is_slotted(self):
+        """Test Term fields keep JSON-LD metadata in a slot, not a __dict__."""
+        field = Term("schema:name", type_="xsd:string")
+        assert not hasattr(field, "__dict__")
+        assert field.jsonld_meta["iri"] == "schema:name"
+        assert field.jsonld_meta["type"] == "xsd:string"
 
 
 class TestJsonLDModel:
@@ -102,6 +109,21 @@ class TestJsonLDModel:
         assert TestModel._json_ld_remote_contexts == ["https://schema.org/"]
         assert TestModel._json_ld_prefixes == {"ex": "https://example.org/"}
     
+    def test_configure_jsonld_shares_prefixes(self):
+        """Test models configured with identical prefixes share one mapping."""
+        class FirstModel(JsonLDModel):
+            name: str = Term("schema:name")
+        
+        class SecondModel(JsonLDModel):
+            name: str = Term("schema:name")
+        
+        prefixes = {"schema": "https://schema.org/", "ex": "https://example.org/"}
+        FirstModel.configure_jsonld(prefixes=prefixes)
+        SecondModel.configure_jsonld(prefixes=dict(prefixes))
+        
+        assert FirstModel._json_ld_prefixes is SecondModel._json_ld_prefixes
+        assert FirstModel._json_ld_prefixes == prefixes
+    
     def test_export_context_basic(self):
         """Test basic context export."""
         class TestModel(JsonLDModel):
@@ -162,6 +184,21 @@ class TestJsonLDModel:
         assert ctx[2]["ex"] == "https://example.org/"
         assert ctx[2]["name"]["@id"] == "schema:name"
     
+    def test_export_context_cached_per_configuration(self):
+        """Test context caching returns independent copies and tracks configuration."""
+        class TestModel(JsonLDModel):
+            name: str = Term("schema:name")
+        
+        first = TestModel.export_context()
+        first["@context"]["name"]["@id"] = "changed"
+        
+        second = TestModel.export_context()
+        assert second["@context"]["name"]["@id"] == "schema:name"
+        
+        TestModel.configure_jsonld(vocab="https://schema.org/")
+        third = TestModel.export_context()
+        assert third["@context"]["@vocab"] == "https://schema.org/"
+    
     def test_export_context_with_aliases(self):
         """Test context export with field aliases."""
         class TestModel(JsonLDModel):
@@ -243,6 +280,37 @@ class TestJsonLDModel:
         assert node_shape is not None
         assert "sh:targetClass" in node_shape
         assert "sh:property" in node_shape
+    
+    def test_export_shacl_cached_per_configuration(self):
+        """Test SHACL caching returns independent copies and tracks configuration."""
+        class TestModel(JsonLDModel):
+            name: str = Term("schema:name")
+        
+        first = TestModel.export_shacl()
+        first["@graph"].clear()
+        
+        second = TestModel.export_shacl()
+        assert len(second["@graph"]) == 2
+        
+        TestModel.configure_jsonld(base="https://example.org/")
+        third = TestModel.export_shacl()
+        assert third["@graph"][0]["@id"] == "https://example.org/shapes/TestModelShape"
+    
+    def test_exported_model_classes_can_be_collected(self):
+        """Test the export caches do not keep dynamically created models alive."""
+        import gc
+        import weakref
+        
+        class TempModel(JsonLDModel):
+            name: str = Term("schema:name")
+        
+        TempModel.export_context()
+        TempModel.export_shacl()
+        ref = weakref.ref(TempModel)
+        
+        del TempModel
+        gc.collect()
+        assert ref() is None
 
 
 class TestComplexModel:
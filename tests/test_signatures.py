@@ -2,6 +2,7 @@
 Tests for signature functionality.
 """
 
+import copy
 import json
 import pytest
 from datetime import datetime, timezone
@@ -13,6 +14,7 @@ from pydantic_jsonld import (
     generate_ed25519_keypair,
     sign_jsonld_document,
     verify_jsonld_document,
+    verify_jsonld_documents,
     canonicalize_jsonld,
     private_key_to_base64,
     public_key_to_base64,
@@ -24,6 +26,7 @@ from pydantic_jsonld.crypto_utils import (
     public_key_to_bytes,
     private_key_from_bytes,
     public_key_from_bytes,
+    public_keys_from_bytes,
     generate_key_id,
 )
 from pydantic_jsonld.signatures import (
@@ -65,6 +68,14 @@ ProductModel.configure_jsonld(
 )
 
 
+@pytest.fixture(scope="module")
+def signed_person(ed25519_keypair):
+    """Alice signed once with the session key pair; read-only, deepcopy before mutating."""
+    private_key, _ = ed25519_keypair
+    person = PersonModel(name="Alice", email="alice@example.com", age=30)
+    return person, person.sign(private_key)
+
+
 class TestCryptoUtils:
     """Test cryptographic utility functions."""
     
@@ -78,9 +89,9 @@ class TestCryptoUtils:
         # Keys should be related
         assert private_key.public_key().public_bytes_raw() == public_key.public_bytes_raw()
     
-    def test_key_to_bytes_conversion(self):
+    def test_key_to_bytes_conversion(self, ed25519_keypair):
         """Test key to bytes conversion."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         # Convert to bytes
         private_bytes = private_key_to_bytes(private_key)
@@ -98,9 +109,9 @@ class TestCryptoUtils:
         assert private_key_to_bytes(private_key2) == private_bytes
         assert public_key_to_bytes(public_key2) == public_bytes
     
-    def test_key_to_base64_conversion(self):
+    def test_key_to_base64_conversion(self, ed25519_keypair):
         """Test key to base64 conversion."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         # Convert to base64
         private_b64 = private_key_to_base64(private_key)
@@ -118,15 +129,16 @@ class TestCryptoUtils:
         assert private_key_to_base64(private_key2) == private_b64
         assert public_key_to_base64(public_key2) == public_b64
     
-    def test_generate_key_id(self):
+    def test_generate_key_id(self, ed25519_keypair):
         """Test key ID generation."""
-        _, public_key = generate_ed25519_keypair()
+        _, public_key = ed25519_keypair
         
         key_id = generate_key_id(public_key)
         
         assert isinstance(key_id, str)
         assert key_id.startswith("key-")
         assert len(key_id) == 12  # "key-" + 8 chars
+        assert key_id == f"key-{public_key_to_base64(public_key)[:8]}"
     
     def test_invalid_key_bytes(self):
         """Test error handling for invalid key bytes."""
@@ -136,6 +148,21 @@ class TestCryptoUtils:
         with pytest.raises(ValueError, match="exactly 32 bytes"):
             public_key_from_bytes(b"invalid")
     
+    def test_public_keys_from_bytes(self, ed25519_keypair, alt_ed25519_keypair):
+        """Test loading several public keys from one buffer."""
+        public_keys = [ed25519_keypair[1], alt_ed25519_keypair[1]]
+        buffer = b"".join(public_key_to_bytes(key) for key in public_keys)
+        
+        loaded = public_keys_from_bytes(buffer)
+        
+        assert [public_key_to_bytes(key) for key in loaded] == [
+            public_key_to_bytes(key) for key in public_keys
+        ]
+        assert public_keys_from_bytes(b"") == []
+        
+        with pytest.raises(ValueError, match="multiple of 32 bytes"):
+            public_keys_from_bytes(buffer[:-1])
+    
     def test_invalid_base64_keys(self):
         """Test error handling for invalid base64 keys."""
         with pytest.raises(ValueError, match="Invalid base64"):
@@ -172,6 +199,109 @@ class TestSignatures:
         canonical = canonicalize_jsonld(document)
         assert isinstance(canonical, bytes)
     
+    def test_canonicalization_shared_by_sign_and_verify(self, ed25519_keypair, monkeypatch):
+        """Test verifying a freshly signed document reuses its canonical form."""
+        import uuid
+        import pyld
+        
+        calls = []
+        to_rdf = pyld.jsonld.to_rdf
+        
+        def counting_to_rdf(*args, **kwargs):
+            calls.append(args[0])
+            return to_rdf(*args, **kwargs)
+        
+        monkeypatch.setattr(pyld.jsonld, "to_rdf", counting_to_rdf)
+        
+        private_key, public_key = ed25519_keypair
+        document = {
+            "@context": {"name": "https://schema.org/name"},
+            "name": f"Alice {uuid.uuid4()}"
+        }
+        
+        signed_doc = sign_jsonld_document(document, private_key)
+        assert verify_jsonld_document(signed_doc, public_key) is True
+        assert len(calls) == 1
+        
+        # A modified document is canonicalized again, not served from cache
+        signed_doc["name"] = "Bob"
+        assert verify_jsonld_document(signed_doc, public_key) is False
+        assert len(calls) == 2
+    
+    def test_canonicalization_cache_keyed_on_document_loader(self, monkeypatch):
+        """Test a remote context resolved by a different loader is not served from cache."""
+        import pyld
+        
+        def loader_for(iri):
+            def loader(url, options=None):
+                return {
+                    "contextUrl": None,
+                    "documentUrl": url,
+                    "document": {"@context": {"name": iri}}
+                }
+            return loader
+        
+        document = {"@context": "https://example.org/context.jsonld", "name": "Alice"}
+        
+        monkeypatch.setattr(pyld.jsonld, "get_document_loader", lambda: loader_for("https://schema.org/name"))
+        first = canonicalize_jsonld(document)
+        monkeypatch.setattr(pyld.jsonld, "get_document_loader", lambda: loader_for("https://example.org/name"))
+        second = canonicalize_jsonld(document)
+        
+        assert b"https://schema.org/name" in first
+        assert b"https://example.org/name" in second
+    
+    def test_large_documents_not_cached(self, monkeypatch):
+        """Test documents over the size limit are canonicalized on every call."""
+        import pyld
+        
+        calls = []
+        to_rdf = pyld.jsonld.to_rdf
+        
+        def counting_to_rdf(*args, **kwargs):
+            calls.append(args[0])
+            return to_rdf(*args, **kwargs)
+        
+        monkeypatch.setattr(pyld.jsonld, "to_rdf", counting_to_rdf)
+        
+        document = {
+            "@context": {"description": "https://schema.org/description"},
+            "description": "x" * (70 * 1024)
+        }
+        first = canonicalize_jsonld(document)
+        second = canonicalize_jsonld(document)
+        
+        assert first == second
+        assert len(calls) == 2
+    
+    def test_canonicalize_matches_pyld_normalize(self):
+        """Test canonical output is byte-identical to PyLD's URDNA2015, with and without blank nodes."""
+        import pyld
+        
+        context = {"@vocab": "https://schema.org/"}
+        documents = [
+            # No blank nodes: sorted N-Quads fast path
+            {
+                "@context": context,
+                "@id": "https://example.org/alice",
+                "name": "Alice",
+                "knows": {"@id": "https://example.org/bob"},
+                "keywords": ["b", "a"]
+            },
+            # Blank nodes: full canonical labelling
+            {
+                "@context": context,
+                "name": "Alice",
+                "knows": [{"name": "Bob"}, {"name": "Carol"}]
+            },
+        ]
+        
+        for document in documents:
+            expected = pyld.jsonld.normalize(
+                document, {"algorithm": "URDNA2015", "format": "application/n-quads"}
+            )
+            assert canonicalize_jsonld(document) == expected.encode("utf-8")
+    
     def test_create_proof_object(self):
         """Test proof object creation."""
         verification_method = "key-abc123"
@@ -202,9 +332,9 @@ class TestSignatures:
         # Should be valid ISO 8601
         datetime.fromisoformat(created.replace("Z", "+00:00"))
     
-    def test_sign_and_verify_document(self):
+    def test_sign_and_verify_document(self, ed25519_keypair):
         """Test signing and verifying a JSON-LD document."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -229,10 +359,10 @@ class TestSignatures:
         is_valid = verify_jsonld_document(signed_doc, public_key)
         assert is_valid is True
     
-    def test_verify_with_wrong_key(self):
+    def test_verify_with_wrong_key(self, ed25519_keypair, alt_ed25519_keypair):
         """Test verification with wrong public key."""
-        private_key1, _ = generate_ed25519_keypair()
-        _, public_key2 = generate_ed25519_keypair()
+        private_key1, _ = ed25519_keypair
+        _, public_key2 = alt_ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -246,9 +376,9 @@ class TestSignatures:
         is_valid = verify_jsonld_document(signed_doc, public_key2)
         assert is_valid is False
     
-    def test_verify_tampered_document(self):
+    def test_verify_tampered_document(self, ed25519_keypair):
         """Test verification of tampered document."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -265,9 +395,32 @@ class TestSignatures:
         is_valid = verify_jsonld_document(signed_doc, public_key)
         assert is_valid is False
     
-    def test_verify_invalid_signature_format(self):
+    def test_verify_multiple_documents(self, ed25519_keypair, alt_ed25519_keypair):
+        """Test verifying several signed documents at once."""
+        private_key, public_key = ed25519_keypair
+        _, other_public_key = alt_ed25519_keypair
+        
+        signed_docs = [
+            sign_jsonld_document(
+                {"@context": {"name": "https://schema.org/name"}, "name": name},
+                private_key
+            )
+            for name in ("Alice", "Bob", "Carol")
+        ]
+        signed_docs[1]["name"] = "Mallory"
+        
+        results = verify_jsonld_documents([
+            (signed_docs[0], public_key),
+            (signed_docs[1], public_key),
+            (signed_docs[2], other_public_key),
+        ])
+        
+        assert results == [True, False, False]
+        assert verify_jsonld_documents([]) == []
+    
+    def test_verify_invalid_signature_format(self, ed25519_keypair):
         """Test verification with invalid signature format."""
-        _, public_key = generate_ed25519_keypair()
+        _, public_key = ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -284,9 +437,9 @@ class TestSignatures:
         is_valid = verify_jsonld_document(document, public_key)
         assert is_valid is False
     
-    def test_extract_proof_metadata(self):
+    def test_extract_proof_metadata(self, ed25519_keypair):
         """Test extracting proof metadata."""
-        private_key, _ = generate_ed25519_keypair()
+        private_key, _ = ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -302,9 +455,9 @@ class TestSignatures:
         assert "created" in metadata
         assert "proofValue" not in metadata  # Should be excluded
     
-    def test_remove_proof(self):
+    def test_remove_proof(self, ed25519_keypair):
         """Test removing proof from signed document."""
-        private_key, _ = generate_ed25519_keypair()
+        private_key, _ = ed25519_keypair
         
         document = {
             "@context": {"name": "https://schema.org/name"},
@@ -317,17 +470,22 @@ class TestSignatures:
         assert "proof" not in unsigned_doc
         assert unsigned_doc["name"] == "Alice"
         assert unsigned_doc["@context"] == document["@context"]
+        assert "proof" in signed_doc
+        
+        # copy=True gives a document that shares nothing with the original
+        independent_doc = remove_proof(signed_doc, copy=True)
+        assert independent_doc == unsigned_doc
+        independent_doc["@context"]["name"] = "changed"
+        assert signed_doc["@context"]["name"] == "https://schema.org/name"
 
 
 class TestSignableJsonLDModel:
     """Test SignableJsonLDModel functionality."""
     
-    def test_sign_model_instance(self):
+    def test_sign_model_instance(self, ed25519_keypair, signed_person):
         """Test signing a model instance."""
-        private_key, public_key = generate_ed25519_keypair()
-        
-        person = PersonModel(name="Alice", email="alice@example.com", age=30)
-        signed_doc = person.sign(private_key)
+        _, public_key = ed25519_keypair
+        _, signed_doc = signed_person
         
         # Check structure
         assert "@context" in signed_doc
@@ -340,9 +498,19 @@ class TestSignableJsonLDModel:
         is_valid = PersonModel.verify(signed_doc, public_key)
         assert is_valid is True
     
-    def test_sign_with_bytes_key(self):
+    def test_sign_does_not_modify_cached_context(self, ed25519_keypair):
+        """Test signed documents don't share the class's cached context."""
+        private_key, _ = ed25519_keypair
+        
+        person = PersonModel(name="Alice", email="alice@example.com", age=30)
+        signed_doc = person.sign(private_key)
+        signed_doc["@context"]["name"]["@id"] = "changed"
+        
+        assert PersonModel.export_context()["@context"]["name"]["@id"] == "schema:name"
+    
+    def test_sign_with_bytes_key(self, ed25519_keypair):
         """Test signing with raw bytes key."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         private_bytes = private_key_to_bytes(private_key)
         public_bytes = public_key_to_bytes(public_key)
         
@@ -352,9 +520,9 @@ class TestSignableJsonLDModel:
         is_valid = PersonModel.verify(signed_doc, public_bytes)
         assert is_valid is True
     
-    def test_sign_with_custom_params(self):
+    def test_sign_with_custom_params(self, ed25519_keypair):
         """Test signing with custom parameters."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         person = PersonModel(name="Alice", email="alice@example.com", age=30)
         signed_doc = person.sign(
@@ -372,12 +540,9 @@ class TestSignableJsonLDModel:
         is_valid = PersonModel.verify(signed_doc, public_key)
         assert is_valid is True
     
-    def test_extract_data_from_signed_document(self):
+    def test_extract_data_from_signed_document(self, signed_person):
         """Test extracting model data from signed document."""
-        private_key, _ = generate_ed25519_keypair()
-        
-        person = PersonModel(name="Alice", email="alice@example.com", age=30)
-        signed_doc = person.sign(private_key)
+        _, signed_doc = signed_person
         
         extracted_data = PersonModel.extract_data(signed_doc)
         
@@ -386,13 +551,14 @@ class TestSignableJsonLDModel:
             "email": "alice@example.com", 
             "age": 30
         }
+        
+        # The signed document itself is left untouched
+        assert "proof" in signed_doc
+        assert "@context" in signed_doc
     
-    def test_from_signed_document(self):
+    def test_from_signed_document(self, signed_person):
         """Test creating model instance from signed document."""
-        private_key, _ = generate_ed25519_keypair()
-        
-        original = PersonModel(name="Alice", email="alice@example.com", age=30)
-        signed_doc = original.sign(private_key)
+        original, signed_doc = signed_person
         
         recreated = PersonModel.from_signed_document(signed_doc)
         
@@ -400,9 +566,9 @@ class TestSignableJsonLDModel:
         assert recreated.email == original.email
         assert recreated.age == original.age
     
-    def test_get_proof_metadata(self):
+    def test_get_proof_metadata(self, ed25519_keypair):
         """Test getting proof metadata from signed document."""
-        private_key, _ = generate_ed25519_keypair()
+        private_key, _ = ed25519_keypair
         
         person = PersonModel(name="Alice", email="alice@example.com", age=30)
         signed_doc = person.sign(private_key, verification_method="test-key")
@@ -430,9 +596,9 @@ class TestSignableJsonLDModel:
         with pytest.raises(ValueError, match="must be Ed25519PublicKey"):
             PersonModel.verify(signed_doc, "invalid-key")
     
-    def test_model_with_alias_signing(self):
+    def test_model_with_alias_signing(self, ed25519_keypair):
         """Test signing model with field aliases."""
-        private_key, public_key = generate_ed25519_keypair()
+        private_key, public_key = ed25519_keypair
         
         product = ProductModel(
             identifier="product-123",
@@ -454,15 +620,12 @@ class TestSignableJsonLDModel:
 class TestIntegration:
     """Integration tests combining multiple features."""
     
-    def test_sign_verify_roundtrip(self):
+    def test_sign_verify_roundtrip(self, ed25519_keypair, signed_person):
         """Test complete sign/verify roundtrip."""
-        private_key, public_key = generate_ed25519_keypair()
+        _, public_key = ed25519_keypair
         
-        # Create model
-        person = PersonModel(name="Alice", email="alice@example.com", age=30)
-        
-        # Sign it
-        signed_doc = person.sign(private_key)
+        # Model signed once for the module
+        person, signed_doc = signed_person
         
         # Verify signature
         assert PersonModel.verify(signed_doc, public_key) is True
@@ -491,9 +654,9 @@ class TestIntegration:
         proof2 = signed_doc2["proof"]["proofValue"]
         assert proof1 != proof2
     
-    def test_deterministic_signatures(self):
+    def test_deterministic_signatures(self, ed25519_keypair):
         """Test that same input produces same signature."""
-        private_key, _ = generate_ed25519_keypair()
+        private_key, _ = ed25519_keypair
         
         person = PersonModel(name="Alice", email="alice@example.com", age=30)
         fixed_time = "2025-07-15T14:30:00Z"
@@ -504,13 +667,38 @@ class TestIntegration:
         # Should be identical
         assert signed_doc1 == signed_doc2
     
-    def test_explicit_signature_verification(self):
+    def test_sign_many(self, ed25519_keypair):
+        """Test batch signing matches signing each instance individually."""
+        private_key, public_key = ed25519_keypair
+        
+        people = [
+            PersonModel(name="Alice", email="alice@example.com", age=30),
+            PersonModel(name="Bob", email="bob@example.com", age=None),
+        ]
+        
+        signed_docs = PersonModel.sign_many(people, private_key)
+        
+        assert len(signed_docs) == 2
+        assert all(PersonModel.verify(doc, public_key) for doc in signed_docs)
+        
+        # Every proof in the batch shares one timestamp and key id
+        created = signed_docs[0]["proof"]["created"]
+        assert signed_docs[1]["proof"]["created"] == created
+        assert signed_docs[0]["proof"]["verificationMethod"] == generate_key_id(public_key)
+        
+        # Same output as signing one at a time
+        assert signed_docs == [
+            person.sign(private_key, created=created) for person in people
+        ]
+    
+    def test_explicit_signature_verification(
+        self, ed25519_keypair, alt_ed25519_keypair, signed_person
+    ):
         """Explicit test to verify signatures are cryptographically sound."""
-        private_key, public_key = generate_ed25519_keypair()
+        _, public_key = ed25519_keypair
         
-        # Create and sign model
-        person = PersonModel(name="Alice", email="alice@example.com", age=30)
-        signed_doc = person.sign(private_key)
+        # Model signed once for the module
+        _, signed_doc = signed_person
         
         # Test 1: Verify with correct key
         is_valid1 = PersonModel.verify(signed_doc, public_key)
@@ -521,12 +709,12 @@ class TestIntegration:
         assert is_valid2 is True, "Low-level verification should match high-level"
         
         # Test 3: Verify with wrong key
-        _, wrong_public_key = generate_ed25519_keypair()
+        _, wrong_public_key = alt_ed25519_keypair
         is_valid3 = PersonModel.verify(signed_doc, wrong_public_key)
         assert is_valid3 is False, "Wrong key should fail verification"
         
         # Test 4: Verify tampered document
-        tampered_doc = signed_doc.copy()
+        tampered_doc = copy.deepcopy(signed_doc)
         tampered_doc["name"] = "Bob"  # Change the name
         is_valid4 = PersonModel.verify(tampered_doc, public_key)
         assert is_valid4 is False, "Tampered document should fail verification"
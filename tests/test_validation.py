@@ -3,9 +3,19 @@ Tests for the validation module.
 """
 
 import pytest
+from types import MappingProxyType
 from pydantic import ValidationError
 
-from pydantic_jsonld.validation import validate_context, ContextTerm, JsonLDContext
+from pydantic_jsonld.validation import validate_context, ContextTerm, ErrorCode, JsonLDContext
+
+
+@pytest.fixture(scope="module")
+def valid_simple_context():
+    """Read-only simple context shared by the tests in this module."""
+    return MappingProxyType({
+        "name": MappingProxyType({"@id": "schema:name"}),
+        "age": MappingProxyType({"@id": "schema:age", "@type": "xsd:integer"})
+    })
 
 
 class TestContextTerm:
@@ -13,252 +23,210 @@ class TestContextTerm:
     
     def test_valid_term(self):
         """Test valid term definition."""
-        term = ContextTerm(term_definition={"@id": "schema:name"})
-        assert term.term_definition["@id"] == "schema:name"
+        term = ContextTerm.validate_python({"@id": "schema:name"})
+        assert term["@id"] == "schema:name"
     
     def test_valid_term_with_type(self):
         """Test valid term with type."""
-        term = ContextTerm(term_definition={
+        term = ContextTerm.validate_python({
             "@id": "schema:name",
             "@type": "xsd:string"
         })
-        assert term.term_definition["@type"] == "xsd:string"
+        assert term["@type"] == "xsd:string"
     
     def test_valid_term_with_container(self):
         """Test valid term with container."""
-        term = ContextTerm(term_definition={
+        term = ContextTerm.validate_python({
             "@id": "schema:keywords",
             "@container": "@set"
         })
-        assert term.term_definition["@container"] == "@set"
+        assert term["@container"] == "@set"
     
     def test_valid_term_with_language(self):
         """Test valid term with language."""
-        term = ContextTerm(term_definition={
+        term = ContextTerm.validate_python({
             "@id": "schema:name",
             "@language": "en"
         })
-        assert term.term_definition["@language"] == "en"
-    
-    def test_missing_id(self):
-        """Test term without @id raises error."""
-        with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={"@type": "xsd:string"})
-        
-        assert "must have @id property" in str(exc_info.value)
-    
-    def test_unknown_keyword(self):
-        """Test term with unknown keyword raises error."""
-        with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={
-                "@id": "schema:name",
-                "@unknown": "value"
-            })
-        
-        assert "Unknown JSON-LD keywords" in str(exc_info.value)
-    
-    def test_invalid_type_value(self):
-        """Test term with invalid @type value."""
-        with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={
-                "@id": "schema:name",
-                "@type": 123  # Should be string
-            })
-        
-        assert "@type must be a string" in str(exc_info.value)
-    
-    def test_invalid_container_value(self):
-        """Test term with invalid @container value."""
-        with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={
-                "@id": "schema:name",
-                "@container": "invalid"
-            })
-        
-        assert "Invalid @container value" in str(exc_info.value)
+        assert term["@language"] == "en"
     
     def test_valid_container_list(self):
         """Test term with valid @container list."""
-        term = ContextTerm(term_definition={
+        term = ContextTerm.validate_python({
             "@id": "schema:name",
             "@container": ["@set", "@language"]
         })
-        assert term.term_definition["@container"] == ["@set", "@language"]
+        assert term["@container"] == ["@set", "@language"]
     
-    def test_invalid_container_list(self):
-        """Test term with invalid @container list."""
-        with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={
-                "@id": "schema:name",
-                "@container": ["@set", "invalid"]
-            })
-        
-        assert "Invalid @container value" in str(exc_info.value)
+    def test_valid_graph_container_with_index(self):
+        """Test term with JSON-LD 1.1 @graph container and @index keyword."""
+        term = ContextTerm.validate_python({
+            "@id": "schema:hasPart",
+            "@container": ["@graph", "@index"],
+            "@index": "schema:name"
+        })
+        assert term["@container"] == ["@graph", "@index"]
     
-    def test_invalid_language_value(self):
-        """Test term with invalid @language value."""
+    @pytest.mark.parametrize("term_definition,code", [
+        ({"@type": "xsd:string"}, ErrorCode.MISSING_ID),
+        ({"@id": "schema:name", "@unknown": "value"}, ErrorCode.UNKNOWN_KEYWORD),
+        ({"@id": "schema:name", "@type": 123}, ErrorCode.INVALID_TYPE),
+        ({"@id": "schema:name", "@container": "invalid"}, ErrorCode.INVALID_CONTAINER),
+        ({"@id": "schema:name", "@container": ["@set", "invalid"]}, ErrorCode.INVALID_CONTAINER),
+        ({"@id": "schema:name", "@language": 123}, ErrorCode.INVALID_LANGUAGE),
+        ({"@id": "schema:name", 1: "value", "@foo": 2}, ErrorCode.UNKNOWN_KEYWORD),
+    ], ids=[
+        "missing_id",
+        "unknown_keyword",
+        "invalid_type",
+        "invalid_container",
+        "invalid_container_list",
+        "invalid_language",
+        "unknown_keywords_of_mixed_types",
+    ])
+    def test_term_invalid(self, term_definition, code):
+        """Test invalid term definitions raise the matching error code."""
         with pytest.raises(ValidationError) as exc_info:
-            ContextTerm(term_definition={
-                "@id": "schema:name",
-                "@language": 123  # Should be string
-            })
+            ContextTerm.validate_python(term_definition)
         
-        assert "@language must be a string" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["ctx"]["code"] is code
 
 
 class TestJsonLDContext:
     """Test the JsonLDContext validation."""
     
-    def test_valid_simple_context(self):
+    def test_valid_simple_context(self, valid_simple_context):
         """Test valid simple context."""
-        context = JsonLDContext(context={
-            "name": {"@id": "schema:name"},
-            "age": {"@id": "schema:age", "@type": "xsd:integer"}
-        })
-        assert "name" in context.context
-        assert "age" in context.context
+        context = JsonLDContext.validate_python(valid_simple_context)
+        assert "name" in context
+        assert "age" in context
     
     def test_valid_context_with_keywords(self):
         """Test valid context with JSON-LD keywords."""
-        context = JsonLDContext(context={
+        context = JsonLDContext.validate_python({
             "@version": 1.1,
             "@base": "https://example.org/",
             "@vocab": "https://schema.org/",
             "name": {"@id": "schema:name"}
         })
-        assert context.context["@version"] == 1.1
-        assert context.context["@base"] == "https://example.org/"
-        assert context.context["@vocab"] == "https://schema.org/"
+        assert context["@version"] == 1.1
+        assert context["@base"] == "https://example.org/"
+        assert context["@vocab"] == "https://schema.org/"
     
     def test_valid_context_array(self):
         """Test valid context array."""
-        context = JsonLDContext(context=[
+        context = JsonLDContext.validate_python([
             "https://schema.org/",
             {
                 "name": {"@id": "schema:name"},
                 "age": {"@id": "schema:age", "@type": "xsd:integer"}
             }
         ])
-        assert isinstance(context.context, list)
-        assert len(context.context) == 2
+        assert isinstance(context, list)
+        assert len(context) == 2
     
     def test_valid_string_mappings(self):
         """Test valid string mappings in context."""
-        context = JsonLDContext(context={
+        context = JsonLDContext.validate_python({
             "schema": "https://schema.org/",
             "name": "schema:name"  # Simple string mapping
         })
-        assert context.context["schema"] == "https://schema.org/"
-        assert context.context["name"] == "schema:name"
-    
-    def test_invalid_version(self):
-        """Test invalid @version value."""
-        with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@version": 2.0,  # Should be 1.1
-                "name": {"@id": "schema:name"}
-            })
-        
-        assert "@version must be 1.1" in str(exc_info.value)
-    
-    def test_invalid_base(self):
-        """Test invalid @base value."""
-        with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@base": 123,  # Should be string
-                "name": {"@id": "schema:name"}
-            })
-        
-        assert "@base must be a string" in str(exc_info.value)
+        assert context["schema"] == "https://schema.org/"
+        assert context["name"] == "schema:name"
     
-    def test_invalid_vocab(self):
-        """Test invalid @vocab value."""
+    def test_invalid_remote_url_reports_array_index(self):
+        """Test an invalid remote context URL is reported at its array position."""
         with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@vocab": 123,  # Should be string
-                "name": {"@id": "schema:name"}
-            })
-        
-        assert "@vocab must be a string" in str(exc_info.value)
-    
-    def test_invalid_language(self):
-        """Test invalid @language value."""
-        with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@language": 123,  # Should be string
-                "name": {"@id": "schema:name"}
-            })
+            JsonLDContext.validate_python([
+                {"name": {"@id": "schema:name"}},
+                "https://schema.org/",
+                "invalid-url"
+            ])
         
-        assert "@language must be a string" in str(exc_info.value)
+        error = exc_info.value.errors()[0]
+        assert error["ctx"]["code"] is ErrorCode.INVALID_URL
+        assert error["ctx"]["index"] == 2
     
-    def test_invalid_protected(self):
-        """Test invalid @protected value."""
+    @pytest.mark.parametrize("context,index", [
+        ([{"name": "schema:name"}, "https://schema.org/", "invalid-url"], 2),
+        (["https://schema.org/", "invalid-url", {"age": "schema:age"}], 1),
+    ], ids=["after_local_context", "before_local_context"])
+    def test_shared_remote_urls_report_array_index(self, context, index):
+        """Test contexts sharing remote URLs each report the invalid URL's own index."""
         with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@protected": "true",  # Should be boolean
-                "name": {"@id": "schema:name"}
-            })
+            JsonLDContext.validate_python(context)
         
-        assert "@protected must be a boolean" in str(exc_info.value)
+        error = exc_info.value.errors()[0]
+        assert error["ctx"]["code"] is ErrorCode.INVALID_URL
+        assert error["ctx"]["index"] == index
     
-    def test_unknown_keyword(self):
-        """Test unknown JSON-LD keyword."""
-        with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "@unknown": "value",
-                "name": {"@id": "schema:name"}
-            })
+    def test_valid_context_tuple(self):
+        """Test a tuple context is validated as an array."""
+        context = JsonLDContext.validate_python(("https://schema.org/", {"name": "schema:name"}))
+        assert context == ["https://schema.org/", {"name": "schema:name"}]
         
-        assert "Unknown JSON-LD keyword" in str(exc_info.value)
-    
-    def test_invalid_term_value(self):
-        """Test invalid term value."""
         with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context={
-                "name": 123  # Should be string or dict
-            })
+            JsonLDContext.validate_python(("https://schema.org/", 123))
         
-        assert "must be string or dict" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["ctx"]["code"] is ErrorCode.INVALID_CONTEXT_TYPE
     
-    def test_invalid_context_array_item(self):
-        """Test invalid item in context array."""
-        with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context=[
-                "https://schema.org/",
-                123  # Should be string or dict
-            ])
-        
-        assert "must be string or dict" in str(exc_info.value)
+    def test_long_remote_context_url(self):
+        """Test remote context URLs are not limited in length."""
+        url = "https://example.org/" + "a" * 3000
+        assert JsonLDContext.validate_python([url]) == [url]
     
-    def test_invalid_remote_context_url(self):
-        """Test invalid remote context URL."""
+    def test_read_only_term_definitions_are_validated(self):
+        """Test read-only term definitions are checked like dicts."""
         with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context=[
-                "invalid-url",  # Should be valid URL
-                {"name": {"@id": "schema:name"}}
-            ])
+            JsonLDContext.validate_python({"name": MappingProxyType({"@type": "xsd:string"})})
         
-        assert "must be a valid URL" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["ctx"]["code"] is ErrorCode.MISSING_ID
     
-    def test_invalid_context_type(self):
-        """Test invalid context type."""
+    @pytest.mark.parametrize("context,code", [
+        ({"@version": 2.0, "name": {"@id": "schema:name"}}, ErrorCode.INVALID_VERSION),
+        ({"@base": 123, "name": {"@id": "schema:name"}}, ErrorCode.INVALID_BASE),
+        ({"@vocab": 123, "name": {"@id": "schema:name"}}, ErrorCode.INVALID_VOCAB),
+        ({"@language": 123, "name": {"@id": "schema:name"}}, ErrorCode.INVALID_LANGUAGE),
+        ({"@protected": "true", "name": {"@id": "schema:name"}}, ErrorCode.INVALID_PROTECTED),
+        ({"@unknown": "value", "name": {"@id": "schema:name"}}, ErrorCode.UNKNOWN_KEYWORD),
+        ({"name": 123}, ErrorCode.INVALID_TERM_VALUE),
+        (["https://schema.org/", 123], ErrorCode.INVALID_CONTEXT_TYPE),
+        (["invalid-url", {"name": {"@id": "schema:name"}}], ErrorCode.INVALID_URL),
+        (["https://", {"name": {"@id": "schema:name"}}], ErrorCode.INVALID_URL),
+        (["ftp://example.org/context.jsonld"], ErrorCode.INVALID_URL),
+        ("invalid", ErrorCode.INVALID_CONTEXT_TYPE),
+        ({1: "schema:name"}, ErrorCode.INVALID_TERM_VALUE),
+        (["https://schema.org/", {2: "schema:name"}], ErrorCode.INVALID_TERM_VALUE),
+    ], ids=[
+        "invalid_version",
+        "invalid_base",
+        "invalid_vocab",
+        "invalid_language",
+        "invalid_protected",
+        "unknown_keyword",
+        "invalid_term_value",
+        "invalid_context_array_item",
+        "invalid_remote_context_url",
+        "remote_context_url_without_host",
+        "remote_context_url_not_http",
+        "invalid_context_type",
+        "non_string_key",
+        "non_string_key_in_array",
+    ])
+    def test_context_invalid(self, context, code):
+        """Test invalid contexts raise the matching error code."""
         with pytest.raises(ValidationError) as exc_info:
-            JsonLDContext(context="invalid")  # Should be dict or list
+            JsonLDContext.validate_python(context)
         
-        assert "Context must be a dictionary or array" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["ctx"]["code"] is code
 
 
 class TestValidateContext:
     """Test the validate_context function."""
     
-    def test_valid_context_document(self):
+    def test_valid_context_document(self, valid_simple_context):
         """Test valid context document."""
-        context_doc = {
-            "@context": {
-                "name": {"@id": "schema:name"},
-                "age": {"@id": "schema:age", "@type": "xsd:integer"}
-            }
-        }
+        context_doc = {"@context": valid_simple_context}
         
         # Should not raise any exception
         validate_context(context_doc)
@@ -289,6 +257,22 @@ class TestValidateContext:
         
         assert "must have @context property" in str(exc_info.value)
     
+    def test_non_mapping_document(self):
+        """Test a document that is not a mapping is reported as missing @context."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_context(["@context"])
+        
+        assert "must have @context property" in str(exc_info.value)
+    
+    def test_mapping_errors_are_not_masked(self):
+        """Test errors raised inside a mapping's lookup are not reported as a missing @context."""
+        class BrokenMapping(dict):
+            def get(self, key, default=None):
+                raise AttributeError("broken")
+        
+        with pytest.raises(AttributeError):
+            validate_context(BrokenMapping({"@context": {"name": "schema:name"}}))
+    
     def test_invalid_context_content(self):
         """Test document with invalid context content."""
         context_doc = {
@@ -313,5 +297,8 @@ class TestValidateContext:
         with pytest.raises(ValueError) as exc_info:
             validate_context(context_doc)
         
-        assert "Invalid JSON-LD context" in str(exc_info.value)
-        assert "must have @id property" in str(exc_info.value)
\ No newline at end of file
+        msg = str(exc_info.value)
+        assert "Invalid JSON-LD context" in msg
+        assert "must have @id property" in msg
+        assert exc_info.value.args == (msg,)
+        assert exc_info.value.__cause__.context["code"] is ErrorCode.MISSING_ID
\ No newline at end of file